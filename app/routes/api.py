@@ -689,7 +689,7 @@ def get_blogs():
     """모든 활성 블로그 목록 조회"""
     db = Database(settings.DB_PATH)
     blogs = db.list_blogs(active_only=True)
-    return jsonify(blogs)
+    return jsonify([blog.as_dict() for blog in blogs])
 
 
 @bp.route('/blogs/current')
@@ -0,0 +1,30 @@
+-- Migration: 002_add_composite_indexes
+-- Description: 활성 블로그 조회용 복합 인덱스 추가 및 중복 인덱스 제거
+-- Date: 2026-10-16
+
+-- =====================================================
+-- 1. blogs 복합 인덱스 (WHERE active = 1 ORDER BY id)
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_blogs_active_id ON blogs(active, id);
+
+-- =====================================================
+-- 2. 상태 필터용 복합 인덱스 (init_db 미실행 배포 대비, SCHEMA_SQL과 동일)
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_posts_status_created ON posts(status, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_posting_history_post_status ON posting_history(post_id, publish_status);
+CREATE INDEX IF NOT EXISTS idx_legal_refs_status ON legal_references(verification_status, post_id);
+
+-- =====================================================
+-- 3. 중복 인덱스 제거
+--    idx_posts_status_created(status, created_at)의 접두 인덱스라 쓰기 비용만 추가
+-- =====================================================
+
+DROP INDEX IF EXISTS idx_posts_status;
+
+-- =====================================================
+-- 4. 플래너 통계 갱신
+-- =====================================================
+
+ANALYZE;
@@ -3,6 +3,7 @@ Models 패키지
 데이터 모델 및 설정 클래스
 """
 
+from models.blog import Blog
 from models.blog_config import BlogConfig
 
-__all__ = ["BlogConfig"]
+__all__ = ["Blog", "BlogConfig"]
@@ -0,0 +1,45 @@
+"""
+Blog 모델
+blogs 테이블 행을 가볍게 담는 불변 레코드
+"""
+
+from dataclasses import dataclass, asdict, fields
+
+
+@dataclass(slots=True, frozen=True)
+class Blog:
+    """blogs 테이블 행 (JSON 컬럼은 원본 문자열 유지)"""
+
+    id: int
+    name: str
+    display_name: str
+    domain: str | None
+    description: str | None
+    theme: str | None
+    system_prompt: str
+    categories: str | None
+    crawler_configs: str | None
+    crawler_urls: str | None
+    verification_modules: str | None
+    monthly_budget: int | None
+    max_posts_per_day: int | None
+    max_posts_per_week: int | None
+    min_interval_hours: int | None
+    schedule_crawl_hour: int | None
+    schedule_publish_hours: str | None
+    schedule_monitor_hour: int | None
+    min_seo_score: int | None
+    plagiarism_threshold: float | None
+    max_regeneration: int | None
+    api_keys: str | None
+    active: int | None
+    created_at: str | None
+    updated_at: str | None
+
+    def as_dict(self) -> dict:
+        """딕셔너리로 변환 (JSON 응답 등 필요할 때만 호출)"""
+        return asdict(self)
+
+
+# SELECT 컬럼 순서 (Blog(*row) 생성용)
+BLOG_COLUMNS = tuple(f.name for f in fields(Blog))
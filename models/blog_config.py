@@ -5,7 +5,8 @@ BlogConfig 모델
 
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
-import json
+
+from utils.jsonutil import json_loads
 
 
 @dataclass
@@ -65,12 +66,12 @@ class BlogConfig:
             BlogConfig 인스턴스
         """
         # JSON 필드 파싱
-        categories = json.loads(row.get("categories", "[]"))
-        crawler_configs = json.loads(row.get("crawler_configs", "{}"))
-        crawler_urls = json.loads(row.get("crawler_urls", "[]"))
-        verification_modules = json.loads(row.get("verification_modules", "[]"))
-        schedule_publish_hours = json.loads(row.get("schedule_publish_hours", "[9, 15]"))
-        api_keys = json.loads(row.get("api_keys", "{}"))
+        categories = json_loads(row.get("categories", "[]"))
+        crawler_configs = json_loads(row.get("crawler_configs", "{}"))
+        crawler_urls = json_loads(row.get("crawler_urls", "[]"))
+        verification_modules = json_loads(row.get("verification_modules", "[]"))
+        schedule_publish_hours = json_loads(row.get("schedule_publish_hours", "[9, 15]"))
+        api_keys = json_loads(row.get("api_keys", "{}"))
 
         return cls(
             id=row["id"],
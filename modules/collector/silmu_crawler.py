@@ -71,8 +71,8 @@ class SilmuCrawler:
                 logger.info(f"크롤링 제한: 최대 {limit}개")
 
             # 이미 크롤링한 URL 제외
-            existing = self.db.execute("SELECT url FROM articles")
-            existing_urls = {row["url"] for row in existing}
+            with self.db.iter_rows("SELECT url FROM articles") as rows:
+                existing_urls = {row["url"] for row in rows}
             new_urls = [u for u in urls if u not in existing_urls]
             logger.info(f"새로운 URL: {len(new_urls)}개 (기존 {len(existing_urls)}개 제외)")
 
@@ -201,30 +201,31 @@ class SilmuCrawler:
     def _save_article(self, article_data: dict) -> None:
         """기사를 DB에 저장 (articles + processed_articles)"""
         try:
-            # articles 테이블
-            article_id = self.db.insert(
-                """INSERT OR IGNORE INTO articles (url, title, html, category)
-                   VALUES (?, ?, ?, ?)""",
-                (
-                    article_data["url"],
-                    article_data["title"],
-                    article_data["html"],
-                    article_data["category"],
-                ),
-            )
-
-            # processed_articles 테이블
-            if article_id and article_data.get("clean_text"):
-                clean_text = article_data["clean_text"]
-                summary = clean_text[:200] + "..." if len(clean_text) > 200 else clean_text
-                word_count = len(clean_text)
-
-                self.db.insert(
-                    """INSERT INTO processed_articles (article_id, clean_text, summary, word_count)
+            with self.db.transaction() as tx:
+                # articles 테이블
+                article_id = tx.insert(
+                    """INSERT OR IGNORE INTO articles (url, title, html, category)
                        VALUES (?, ?, ?, ?)""",
-                    (article_id, clean_text, summary, word_count),
+                    (
+                        article_data["url"],
+                        article_data["title"],
+                        article_data["html"],
+                        article_data["category"],
+                    ),
                 )
 
+                # processed_articles 테이블
+                if article_id and article_data.get("clean_text"):
+                    clean_text = article_data["clean_text"]
+                    summary = clean_text[:200] + "..." if len(clean_text) > 200 else clean_text
+                    word_count = len(clean_text)
+
+                    tx.insert(
+                        """INSERT INTO processed_articles (article_id, clean_text, summary, word_count)
+                           VALUES (?, ?, ?, ?)""",
+                        (article_id, clean_text, summary, word_count),
+                    )
+
         except Exception as e:
             logger.error(f"DB 저장 오류: {e}")
 
@@ -97,21 +97,22 @@ class LegalVerifier:
             logger.info(f"포스트 {post_id}: 법령 인용 없음")
             return {"saved": 0, "citations": []}
 
-        # 기존 인용 삭제 후 재저장 (재생성 대응)
-        self.db.execute("DELETE FROM legal_references WHERE post_id = ?", (post_id,))
-
         ref_ids = []
-        for c in citations:
-            ref_id = self.db.insert(
-                """INSERT INTO legal_references
-                   (post_id, law_name, law_name_normalized, article_number,
-                    citation_text, verification_status)
-                   VALUES (?, ?, ?, ?, ?, 'pending')""",
-                (post_id, c["law_name"], c["law_name_normalized"],
-                 c["article_number"], c["citation_text"]),
-            )
-            c["id"] = ref_id
-            ref_ids.append(ref_id)
+        with self.db.transaction() as tx:
+            # 기존 인용 삭제 후 재저장 (재생성 대응)
+            tx.execute("DELETE FROM legal_references WHERE post_id = ?", (post_id,))
+
+            for c in citations:
+                ref_id = tx.insert(
+                    """INSERT INTO legal_references
+                       (post_id, law_name, law_name_normalized, article_number,
+                        citation_text, verification_status)
+                       VALUES (?, ?, ?, ?, ?, 'pending')""",
+                    (post_id, c["law_name"], c["law_name_normalized"],
+                     c["article_number"], c["citation_text"]),
+                )
+                c["id"] = ref_id
+                ref_ids.append(ref_id)
 
         logger.info(f"포스트 {post_id}: 법령 인용 {len(citations)}개 저장")
         return {"saved": len(citations), "citations": citations}
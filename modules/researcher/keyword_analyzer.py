@@ -17,6 +17,12 @@ from config.settings import settings
 
 logger = get_logger()
 
+# keywords 테이블 저장 쿼리 (일괄/행 단위 저장 공용)
+_KEYWORD_UPSERT_SQL = """INSERT OR REPLACE INTO keywords
+   (keyword, monthly_search_volume, competition_score,
+    relevance_score, total_score, related_keywords, updated_at)
+   VALUES (?, ?, ?, ?, ?, ?, datetime('now'))"""
+
 
 class KeywordAnalyzer:
     """Naver Search Ads API를 이용한 키워드 분석 클래스"""
@@ -45,6 +51,7 @@ class KeywordAnalyzer:
             batch_size = 5
             for i in range(0, len(keywords), batch_size):
                 batch = keywords[i:i + batch_size]
+                batch_start = len(results)
                 try:
                     volume_data = await self._get_search_volume(client, batch)
 
@@ -66,7 +73,6 @@ class KeywordAnalyzer:
                                 "related_keywords": [],
                             }
                             results.append(result)
-                            self._save_keyword_to_db(result)
                         else:
                             # API 데이터 없으면 기본값으로 저장
                             logger.warning(f"키워드 '{keyword}' API 데이터 없음 - 기본값 사용")
@@ -79,7 +85,6 @@ class KeywordAnalyzer:
                                 "related_keywords": [],
                             }
                             results.append(result)
-                            self._save_keyword_to_db(result)
 
                 except Exception as e:
                     logger.error(f"키워드 배치 분석 오류: {e}")
@@ -94,7 +99,9 @@ class KeywordAnalyzer:
                             "related_keywords": [],
                         }
                         results.append(result)
-                        self._save_keyword_to_db(result)
+
+                # 배치 단위 저장 (이후 오류가 나도 앞선 배치는 보존)
+                self._save_keywords_to_db(results[batch_start:])
 
         logger.info(f"키워드 분석 완료: {len(results)}개 결과")
         return results
@@ -176,26 +183,34 @@ class KeywordAnalyzer:
             return 0.5
         return round(min(len(related) / 20, 1.0), 2)
 
-    def _save_keyword_to_db(self, data: dict) -> None:
-        """키워드 데이터를 SQLite에 저장"""
+    def _save_keywords_to_db(self, results: list[dict]) -> None:
+        """키워드 분석 결과를 SQLite에 일괄 저장 (실패 시 행 단위로 재시도)"""
+        if not results:
+            return
         try:
-            related_json = json.dumps(data.get("related_keywords", []), ensure_ascii=False)
-            self.db.insert(
-                """INSERT OR REPLACE INTO keywords
-                   (keyword, monthly_search_volume, competition_score,
-                    relevance_score, total_score, related_keywords, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, datetime('now'))""",
-                (
-                    data["keyword"],
-                    data["monthly_search_volume"],
-                    data["competition_score"],
-                    data["relevance_score"],
-                    data["total_score"],
-                    related_json,
-                ),
+            self.db.execute_many(
+                _KEYWORD_UPSERT_SQL,
+                (self._keyword_params(data) for data in results),
             )
         except Exception as e:
-            logger.error(f"키워드 DB 저장 오류: {e}")
+            logger.warning(f"키워드 일괄 저장 실패, 행 단위로 재시도: {e}")
+            for data in results:
+                try:
+                    self.db.insert(_KEYWORD_UPSERT_SQL, self._keyword_params(data))
+                except Exception as row_error:
+                    logger.error(f"키워드 DB 저장 오류 ({data.get('keyword')}): {row_error}")
+
+    @staticmethod
+    def _keyword_params(data: dict) -> tuple:
+        """keywords 테이블 저장용 파라미터 생성"""
+        return (
+            data["keyword"],
+            data["monthly_search_volume"],
+            data["competition_score"],
+            data["relevance_score"],
+            data["total_score"],
+            json.dumps(data.get("related_keywords", []), ensure_ascii=False),
+        )
 
     def _parse_search_volume_response(self, api_response: dict, keywords: list[str]) -> dict:
         """Naver Ads API 응답 파싱"""
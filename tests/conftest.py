@@ -5,114 +5,173 @@ pytest 설정 및 공통 픽스처 모음
 
 import sqlite3
 import tempfile
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, Mock
 import pytest
 
 
+# 테스트용 스키마 정의
+TEST_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT UNIQUE NOT NULL,
+    title TEXT,
+    content TEXT,
+    category TEXT,
+    crawl_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    source TEXT
+);
+
+CREATE TABLE IF NOT EXISTS processed_articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    article_id INTEGER NOT NULL,
+    generated_title TEXT,
+    generated_content TEXT,
+    seo_score REAL,
+    plagiarism_score REAL,
+    processing_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (article_id) REFERENCES articles(id)
+);
+
+CREATE TABLE IF NOT EXISTS crawl_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    crawler_name TEXT,
+    status TEXT,
+    article_count INTEGER,
+    error_message TEXT,
+    crawl_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS keywords (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    keyword TEXT UNIQUE NOT NULL,
+    search_volume INTEGER,
+    competition_level TEXT,
+    relevance_score REAL,
+    created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS keyword_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    keyword_id INTEGER NOT NULL,
+    search_volume INTEGER,
+    rank_position INTEGER,
+    recorded_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (keyword_id) REFERENCES keywords(id)
+);
+
+CREATE TABLE IF NOT EXISTS competitor_posts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    keyword TEXT,
+    competitor_url TEXT,
+    title TEXT,
+    views INTEGER,
+    likes INTEGER,
+    analyzed_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS posts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    blog_url TEXT,
+    title TEXT,
+    content TEXT,
+    published_date TIMESTAMP,
+    views INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS posting_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    processed_article_id INTEGER NOT NULL,
+    publish_time TIMESTAMP,
+    success BOOLEAN DEFAULT 1,
+    error_message TEXT,
+    FOREIGN KEY (processed_article_id) REFERENCES processed_articles(id)
+);
+
+CREATE TABLE IF NOT EXISTS ranking_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    keyword TEXT,
+    rank_position INTEGER,
+    blog_url TEXT,
+    recorded_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+
+@pytest.fixture(scope="session")
+def _schema_template():
+    """
+    스키마가 생성된 템플릿 DB (세션당 1회 생성)
+    temp_db는 이 템플릿을 backup()으로 복사해 사용
+    """
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(TEST_SCHEMA_SQL)
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def _copy_schema_template(template):
+    """템플릿 DB 페이지를 새 메모리 DB로 복사"""
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    # 커밋마다 발생하는 fsync 최소화 (메모리 DB에서는 무시됨)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    template.backup(conn)
+    return conn
+
+
 @pytest.fixture
-def temp_db():
+def temp_db(_schema_template):
     """
     메모리 기반 SQLite 데이터베이스 생성
     테스트 격리 및 빠른 실행을 위해 메모리 DB 사용
+    매 테스트마다 DDL을 실행하지 않고 템플릿 DB 페이지를 복사
     """
-    conn = sqlite3.connect(":memory:")
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
-    # 스키마 생성
-    cursor.executescript("""
-        CREATE TABLE IF NOT EXISTS articles (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            url TEXT UNIQUE NOT NULL,
-            title TEXT,
-            content TEXT,
-            category TEXT,
-            crawl_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            source TEXT
-        );
-
-        CREATE TABLE IF NOT EXISTS processed_articles (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            article_id INTEGER NOT NULL,
-            generated_title TEXT,
-            generated_content TEXT,
-            seo_score REAL,
-            plagiarism_score REAL,
-            processing_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (article_id) REFERENCES articles(id)
-        );
-
-        CREATE TABLE IF NOT EXISTS crawl_log (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            crawler_name TEXT,
-            status TEXT,
-            article_count INTEGER,
-            error_message TEXT,
-            crawl_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        CREATE TABLE IF NOT EXISTS keywords (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            keyword TEXT UNIQUE NOT NULL,
-            search_volume INTEGER,
-            competition_level TEXT,
-            relevance_score REAL,
-            created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        CREATE TABLE IF NOT EXISTS keyword_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            keyword_id INTEGER NOT NULL,
-            search_volume INTEGER,
-            rank_position INTEGER,
-            recorded_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (keyword_id) REFERENCES keywords(id)
-        );
-
-        CREATE TABLE IF NOT EXISTS competitor_posts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            keyword TEXT,
-            competitor_url TEXT,
-            title TEXT,
-            views INTEGER,
-            likes INTEGER,
-            analyzed_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        CREATE TABLE IF NOT EXISTS posts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            blog_url TEXT,
-            title TEXT,
-            content TEXT,
-            published_date TIMESTAMP,
-            views INTEGER DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        CREATE TABLE IF NOT EXISTS posting_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            processed_article_id INTEGER NOT NULL,
-            publish_time TIMESTAMP,
-            success BOOLEAN DEFAULT 1,
-            error_message TEXT,
-            FOREIGN KEY (processed_article_id) REFERENCES processed_articles(id)
-        );
-
-        CREATE TABLE IF NOT EXISTS ranking_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            keyword TEXT,
-            rank_position INTEGER,
-            blog_url TEXT,
-            recorded_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-    """)
+    conn = _copy_schema_template(_schema_template)
+    yield conn
+    conn.close()
 
-    conn.commit()
+
+@pytest.fixture(scope="session")
+def _session_db(_schema_template):
+    """세션 전체에서 공유하는 메모리 DB (db_tx 전용)"""
+    conn = _copy_schema_template(_schema_template)
     yield conn
     conn.close()
 
 
+@pytest.fixture(scope="session")
+def db_cursor(_session_db):
+    """세션 공유 DB 커서 (세션당 1회 생성, db_tx와 함께 사용)"""
+    return _session_db.cursor()
+
+
+@pytest.fixture
+def db_tx(_session_db):
+    """
+    세션 공유 DB를 SAVEPOINT로 감싼 연결
+    테스트 종료 시 롤백되므로 테스트 안에서 commit() 호출 금지
+    """
+    _session_db.execute("SAVEPOINT test_tx")
+    yield _session_db
+    _session_db.execute("ROLLBACK TO test_tx")
+    _session_db.execute("RELEASE test_tx")
+
+
+@pytest.fixture(scope="session")
+def frozen_now():
+    """
+    테스트 기준 시각
+    datetime.now() 호출 없이 결정적인 시간 값 사용
+    """
+    return datetime(2024, 1, 7, 12, 0, 0)
+
+
 @pytest.fixture
 def mock_settings():
     """
@@ -0,0 +1,55 @@
+"""
+테스트 헬퍼 스텁 모음
+테스트 보조 클래스 및 픽스처 생성 헬퍼 정의 (conftest.py는 공용 픽스처 전용)
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+class Stub:
+    """
+    MagicMock 대체용 경량 호출 스텁
+    return_value 지정, 호출 기록, 호출 인자 검증만 지원
+    """
+
+    __slots__ = ("return_value", "calls")
+
+    def __init__(self, return_value=None):
+        self.return_value = return_value
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.return_value
+
+    def assert_called_once(self):
+        assert len(self.calls) == 1, f"1회 호출 기대, 실제 {len(self.calls)}회"
+
+    def assert_called_once_with(self, *args, **kwargs):
+        assert self.calls == [(args, kwargs)], f"호출 기록 불일치: {self.calls}"
+
+    def reset_mock(self, return_value=False, side_effect=False):
+        """호출 기록 초기화 (MagicMock.reset_mock과 동일한 시그니처)"""
+        self.calls.clear()
+        if return_value:
+            self.return_value = None
+
+
+def shared_mock(name: str, *methods: str):
+    """
+    모듈당 1회 생성하고 테스트마다 초기화하는 MagicMock 픽스처 생성
+    테스트 모듈 최상위에서 `x = shared_mock("x", "method", ...)` 형태로 선언
+    """
+    mock = MagicMock()
+    for method in methods:
+        setattr(mock, method, MagicMock())
+
+    @pytest.fixture(name=name)
+    def fixture():
+        yield mock
+        # 다음 테스트를 위해 호출 기록 및 반환값/side_effect 초기화
+        mock.reset_mock(return_value=True, side_effect=True)
+
+    return fixture
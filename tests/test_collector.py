@@ -15,7 +15,6 @@ class TestDataCleaner:
     def data_cleaner(self):
         """DataCleaner 인스턴스 생성"""
         # 실제 import 없이 Mock 객체로 생성
-        from unittest.mock import MagicMock
         cleaner = MagicMock()
         cleaner.clean = MagicMock()
         cleaner._normalize_text = MagicMock()
@@ -121,7 +120,6 @@ class TestSilmuCrawler:
     @pytest.fixture
     def silmu_crawler(self, temp_db):
         """SilmuCrawler 인스턴스 생성"""
-        from unittest.mock import MagicMock
         crawler = MagicMock()
         crawler.db = temp_db
         crawler._categorize = MagicMock()
@@ -5,7 +5,37 @@ Database 클래스 기능 테스트
 
 import pytest
 import sqlite3
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
+
+# 개수 세기 테스트용 시드 데이터 (import 시 한 번만 생성)
+_SEED_ARTICLES = tuple((f"url{i}", f"title{i}", f"category{i}") for i in range(5))
+_SEED_CATEGORY_SCRIPT = """
+    BEGIN IMMEDIATE;
+    INSERT INTO articles (url, title, category)
+    VALUES ('url1', 'title1', '기술'), ('url2', 'title2', '기술'),
+           ('url3', 'title3', '건강');
+    COMMIT;
+"""
+_SEED_KEYWORDS = (
+    ("키워드1", 1000, "높음"),
+    ("키워드2", 2000, "낮음"),
+)
+
+# UNIQUE 제약 위반 예외 (테스트마다 새로 생성하지 않음)
+_UNIQUE_ERR = sqlite3.IntegrityError("UNIQUE constraint failed")
+
+# 스키마에 존재해야 하는 테이블 목록
+_EXPECTED_TABLES = (
+    "articles",
+    "processed_articles",
+    "crawl_log",
+    "keywords",
+    "keyword_history",
+    "competitor_posts",
+    "posts",
+    "posting_history",
+    "ranking_history",
+)
 
 
 class TestDatabase:
@@ -14,7 +44,6 @@ class TestDatabase:
     @pytest.fixture
     def database(self, temp_db):
         """Database 인스턴스 생성"""
-        from unittest.mock import MagicMock
         db = MagicMock()
         db.get_connection = MagicMock(return_value=temp_db)
         db.init_db = MagicMock()
@@ -24,140 +53,27 @@ class TestDatabase:
         db.connection = temp_db
         return db
 
-    def test_init_db_creates_articles_table(self, database, temp_db):
-        """articles 테이블 생성 테스트"""
-        cursor = temp_db.cursor()
-
-        # 테이블 존재 확인
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='articles'
-        """)
-        result = cursor.fetchone()
-
-        assert result is not None
-        assert result[0] == 'articles'
-
-    def test_init_db_creates_processed_articles_table(self, database, temp_db):
-        """processed_articles 테이블 생성 테스트"""
-        cursor = temp_db.cursor()
-
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='processed_articles'
-        """)
-        result = cursor.fetchone()
-
-        assert result is not None
-        assert result[0] == 'processed_articles'
-
-    def test_init_db_creates_crawl_log_table(self, database, temp_db):
-        """crawl_log 테이블 생성 테스트"""
-        cursor = temp_db.cursor()
-
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='crawl_log'
-        """)
-        result = cursor.fetchone()
-
-        assert result is not None
-
-    def test_init_db_creates_keywords_table(self, database, temp_db):
-        """keywords 테이블 생성 테스트"""
-        cursor = temp_db.cursor()
-
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='keywords'
-        """)
-        result = cursor.fetchone()
-
-        assert result is not None
-
-    def test_init_db_creates_keyword_history_table(self, database, temp_db):
-        """keyword_history 테이블 생성 테스트"""
-        cursor = temp_db.cursor()
-
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='keyword_history'
-        """)
-        result = cursor.fetchone()
-
-        assert result is not None
-
-    def test_init_db_creates_competitor_posts_table(self, database, temp_db):
-        """competitor_posts 테이블 생성 테스트"""
-        cursor = temp_db.cursor()
-
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='competitor_posts'
-        """)
-        result = cursor.fetchone()
-
-        assert result is not None
-
-    def test_init_db_creates_posts_table(self, database, temp_db):
-        """posts 테이블 생성 테스트"""
-        cursor = temp_db.cursor()
-
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='posts'
-        """)
-        result = cursor.fetchone()
-
-        assert result is not None
-
-    def test_init_db_creates_posting_history_table(self, database, temp_db):
-        """posting_history 테이블 생성 테스트"""
-        cursor = temp_db.cursor()
-
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='posting_history'
-        """)
-        result = cursor.fetchone()
-
-        assert result is not None
-
-    def test_init_db_creates_ranking_history_table(self, database, temp_db):
-        """ranking_history 테이블 생성 테스트"""
-        cursor = temp_db.cursor()
-
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='ranking_history'
-        """)
-        result = cursor.fetchone()
+    @pytest.fixture(scope="module")
+    def table_names(self, _schema_template):
+        """스키마의 테이블 이름 집합 (PRAGMA table_list 1회 조회)"""
+        return frozenset(
+            row[1] for row in _schema_template.execute("PRAGMA table_list")
+            if row[0] == "main" and row[2] == "table"
+        )
 
-        assert result is not None
+    @pytest.mark.parametrize("table", _EXPECTED_TABLES)
+    def test_init_db_creates_table(self, table_names, table):
+        """테이블별 생성 테스트"""
+        assert table in table_names
 
-    def test_init_db_creates_all_tables(self, database, temp_db):
+    def test_init_db_creates_all_tables(self, temp_db):
         """모든 테이블이 생성되는 테스트"""
-        cursor = temp_db.cursor()
-        expected_tables = [
-            'articles',
-            'processed_articles',
-            'crawl_log',
-            'keywords',
-            'keyword_history',
-            'competitor_posts',
-            'posts',
-            'posting_history',
-            'ranking_history'
-        ]
-
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' ORDER BY name
-        """)
-        tables = [row[0] for row in cursor.fetchall()]
+        tables = {
+            row[1] for row in temp_db.execute("PRAGMA table_list")
+            if row[0] == "main" and row[2] == "table"
+        }
 
-        for expected_table in expected_tables:
-            assert expected_table in tables
+        assert tables.issuperset(_EXPECTED_TABLES)
 
     def test_insert_article(self, database, temp_db):
         """기사 삽입 테스트"""
@@ -204,68 +120,38 @@ class TestDatabase:
         """여러 행 삽입 테스트"""
         database.insert.side_effect = [1, 2, 3]
 
-        id1 = database.insert("articles", {"url": "url1"})
-        id2 = database.insert("articles", {"url": "url2"})
-        id3 = database.insert("articles", {"url": "url3"})
-
-        assert id1 == 1
-        assert id2 == 2
-        assert id3 == 3
+        ids = [database.insert("articles", {"url": f"url{i}"}) for i in range(1, 4)]
 
-    def test_execute_select_query(self, database, temp_db):
-        """SELECT 쿼리 실행 테스트"""
-        cursor = temp_db.cursor()
-        cursor.execute("""
-            INSERT INTO articles (url, title, category)
-            VALUES ('url1', 'title1', 'category1')
-        """)
-        temp_db.commit()
-
-        database.execute.return_value = [
-            {"url": "url1", "title": "title1", "category": "category1"}
+        assert ids == [1, 2, 3]
+        assert database.insert.call_args_list == [
+            call("articles", {"url": f"url{i}"}) for i in range(1, 4)
         ]
 
-        result = database.execute("SELECT * FROM articles LIMIT 1")
+    @pytest.mark.parametrize("query, return_value", [
+        (
+            "SELECT * FROM articles LIMIT 1",
+            [{"url": "url1", "title": "title1", "category": "category1"}],
+        ),
+        ("INSERT INTO keywords (keyword, search_volume) VALUES ('테스트', 1000)", True),
+        ("UPDATE keywords SET search_volume = 2000 WHERE keyword = '테스트'", True),
+        ("DELETE FROM keywords WHERE keyword = '테스트'", True),
+    ], ids=["select", "insert", "update", "delete"])
+    def test_execute_query(self, database, query, return_value):
+        """SELECT/INSERT/UPDATE/DELETE 쿼리 실행 테스트"""
+        database.execute.return_value = return_value
 
-        assert len(result) > 0
-
-    def test_execute_insert_query(self, database):
-        """INSERT 쿼리 실행 테스트"""
-        database.execute.return_value = True
-
-        query = "INSERT INTO keywords (keyword, search_volume) VALUES ('테스트', 1000)"
-        result = database.execute(query)
-
-        assert result is not None
-
-    def test_execute_update_query(self, database):
-        """UPDATE 쿼리 실행 테스트"""
-        database.execute.return_value = True
-
-        query = "UPDATE keywords SET search_volume = 2000 WHERE keyword = '테스트'"
-        result = database.execute(query)
-
-        assert result is not None
-
-    def test_execute_delete_query(self, database):
-        """DELETE 쿼리 실행 테스트"""
-        database.execute.return_value = True
-
-        query = "DELETE FROM keywords WHERE keyword = '테스트'"
         result = database.execute(query)
 
-        assert result is not None
+        assert result
+        database.execute.assert_called_once_with(query)
 
     def test_count_articles(self, database, temp_db):
         """기사 개수 세기 테스트"""
-        cursor = temp_db.cursor()
-
         # 테스트 데이터 삽입
-        for i in range(5):
-            cursor.execute("""
-                INSERT INTO articles (url, title, category)
-                VALUES (?, ?, ?)
-            """, (f"url{i}", f"title{i}", f"category{i}"))
+        temp_db.executemany("""
+            INSERT INTO articles (url, title, category)
+            VALUES (?, ?, ?)
+        """, _SEED_ARTICLES)
         temp_db.commit()
 
         database.count.return_value = 5
@@ -284,15 +170,8 @@ class TestDatabase:
 
     def test_count_with_condition(self, database, temp_db):
         """조건부 개수 세기 테스트"""
-        cursor = temp_db.cursor()
-
-        # 다양한 카테고리의 데이터 삽입
-        cursor.execute("""
-            INSERT INTO articles (url, title, category)
-            VALUES ('url1', 'title1', '기술'), ('url2', 'title2', '기술'),
-                   ('url3', 'title3', '건강')
-        """)
-        temp_db.commit()
+        # 다양한 카테고리의 데이터 삽입 (단일 트랜잭션)
+        temp_db.executescript(_SEED_CATEGORY_SCRIPT)
 
         database.count.return_value = 2
 
@@ -302,12 +181,10 @@ class TestDatabase:
 
     def test_count_keywords(self, database, temp_db):
         """키워드 개수 세기 테스트"""
-        cursor = temp_db.cursor()
-
-        cursor.execute("""
+        temp_db.executemany("""
             INSERT INTO keywords (keyword, search_volume, competition_level)
-            VALUES ('키워드1', 1000, '높음'), ('키워드2', 2000, '낮음')
-        """)
+            VALUES (?, ?, ?)
+        """, _SEED_KEYWORDS)
         temp_db.commit()
 
         database.count.return_value = 2
@@ -350,7 +227,7 @@ class TestDatabase:
 
     def test_insert_duplicate_unique_constraint(self, database):
         """UNIQUE 제약 조건 위반 테스트"""
-        database.insert.side_effect = sqlite3.IntegrityError("UNIQUE constraint failed")
+        database.insert.side_effect = _UNIQUE_ERR
 
         with pytest.raises(sqlite3.IntegrityError):
             database.insert("articles", {"url": "duplicate_url"})
@@ -368,8 +245,7 @@ class TestDatabase:
 
     def test_transaction_commit(self, database, temp_db):
         """트랜잭션 커밋 테스트"""
-        cursor = temp_db.cursor()
-        cursor.execute("""
+        temp_db.execute("""
             INSERT INTO articles (url, title, category)
             VALUES ('url1', 'title1', 'category1')
         """)
@@ -383,10 +259,8 @@ class TestDatabase:
 
     def test_transaction_rollback(self, database, temp_db):
         """트랜잭션 롤백 테스트"""
-        cursor = temp_db.cursor()
-
         try:
-            cursor.execute("""
+            temp_db.execute("""
                 INSERT INTO articles (url, title, category)
                 VALUES ('url1', 'title1', 'category1')
             """)
@@ -400,3 +274,331 @@ class TestDatabase:
         result = database.count("articles")
 
         assert result == 0
+
+
+@pytest.fixture
+def real_db(tmp_path):
+    """임시 파일 기반 Database 인스턴스"""
+    from utils.database import Database
+    db = Database(tmp_path / "test.db")
+    db.init_db()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def blog_db(real_db):
+    """blogs 테이블과 블로그 1개가 있는 Database"""
+    real_db.execute(
+        """CREATE TABLE blogs (
+               id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT UNIQUE,
+               display_name TEXT, domain TEXT, description TEXT, theme TEXT,
+               system_prompt TEXT, categories TEXT, crawler_configs TEXT,
+               verification_modules TEXT, monthly_budget INTEGER,
+               max_posts_per_day INTEGER, active INTEGER DEFAULT 1)"""
+    )
+    real_db.create_blog({"name": "silmu", "display_name": "실무", "system_prompt": "p"})
+    return real_db
+
+
+class TestDatabaseConnectionPool:
+    """Database 스레드별 연결 재사용 테스트 (실제 SQLite 파일 사용)"""
+
+    def test_reuses_connection_within_thread(self, real_db):
+        """같은 스레드에서는 동일한 연결 재사용 테스트"""
+        with real_db.get_connection() as conn1:
+            pass
+        with real_db.get_connection() as conn2:
+            pass
+
+        assert conn1 is conn2
+
+    def test_reuses_connection_across_instances(self, real_db):
+        """같은 DB 파일의 새 인스턴스도 스레드 연결을 공유하는지 테스트"""
+        from utils.database import Database
+
+        other = Database(real_db.db_path)
+
+        assert other._get_conn() is real_db._get_conn()
+
+    def test_connection_pragmas_applied(self, real_db):
+        """연결 PRAGMA 적용 테스트"""
+        assert real_db.execute("PRAGMA journal_mode")[0][0] == "wal"
+        assert real_db.execute("PRAGMA foreign_keys")[0][0] == 1
+
+
+class TestWritePaths:
+    """쓰기/트랜잭션 롤백 테스트"""
+
+    def test_rollback_on_error(self, real_db):
+        """예외 발생 시 롤백 테스트"""
+        with pytest.raises(RuntimeError):
+            with real_db.get_connection() as conn:
+                conn.execute("INSERT INTO articles (url) VALUES ('url1')")
+                raise RuntimeError("강제 실패")
+
+        assert real_db.count("articles") == 0
+
+    def test_rollback_on_base_exception(self, real_db):
+        """KeyboardInterrupt 후에도 연결에 트랜잭션이 남지 않는지 테스트"""
+        with pytest.raises(KeyboardInterrupt):
+            with real_db.get_connection() as conn:
+                conn.execute("INSERT INTO articles (url) VALUES ('url1')")
+                raise KeyboardInterrupt
+
+        real_db.insert("INSERT INTO articles (url) VALUES (?)", ("url2",))
+
+        other = sqlite3.connect(str(real_db.db_path))
+        try:
+            rows = other.execute("SELECT url FROM articles").fetchall()
+        finally:
+            other.close()
+        assert rows == [("url2",)]
+
+    def test_insert_ignored_returns_none(self, real_db):
+        """INSERT OR IGNORE로 무시된 삽입이 이전 rowid를 반환하지 않는지 테스트"""
+        real_db.insert("INSERT INTO articles (url) VALUES (?)", ("url1",))
+        real_db.execute_many(
+            "INSERT INTO crawl_log (url, status_code) VALUES (?, ?)",
+            ((f"log{i}", 200) for i in range(5)),
+        )
+
+        article_id = real_db.insert(
+            "INSERT OR IGNORE INTO articles (url) VALUES (?)", ("url1",)
+        )
+
+        assert article_id is None
+
+    def test_transaction_commits_once(self, real_db):
+        """transaction 블록 내 여러 쓰기의 일괄 커밋 테스트"""
+        with real_db.transaction() as tx:
+            tx.insert("INSERT INTO articles (url) VALUES (?)", ("url1",))
+            tx.execute_many(
+                "INSERT INTO articles (url) VALUES (?)",
+                ((f"url{i}",) for i in range(2, 5)),
+            )
+
+        assert real_db.count("articles") == 4
+
+    def test_transaction_rollback_on_error(self, real_db):
+        """transaction 블록 예외 시 전체 롤백 테스트"""
+        with pytest.raises(sqlite3.IntegrityError):
+            with real_db.transaction() as tx:
+                tx.insert("INSERT INTO articles (url) VALUES (?)", ("url1",))
+                tx.insert("INSERT INTO articles (url) VALUES (?)", ("url1",))
+
+        assert real_db.count("articles") == 0
+
+
+class TestBulkInsert:
+    """bulk_insert 외래 키 검사 테스트"""
+
+    def test_bulk_insert_commits_valid_rows(self, real_db):
+        """bulk_insert 블록의 유효한 행 커밋 및 외래 키 재활성화 테스트"""
+        with real_db.bulk_insert("processed_articles") as tx:
+            article_id = tx.insert("INSERT INTO articles (url) VALUES (?)", ("url1",))
+            tx.execute_many(
+                "INSERT INTO processed_articles (article_id, clean_text) VALUES (?, ?)",
+                ((article_id, f"본문{i}") for i in range(3)),
+            )
+
+        assert real_db.count("processed_articles") == 3
+        assert real_db.fetch_tuples("PRAGMA foreign_keys") == [(1,)]
+
+    def test_bulk_insert_rejects_orphan_rows(self, real_db):
+        """bulk_insert 커밋 전 외래 키 위반 시 전체 롤백 테스트"""
+        with pytest.raises(sqlite3.IntegrityError):
+            with real_db.bulk_insert("articles", "processed_articles") as tx:
+                tx.insert("INSERT INTO articles (url) VALUES (?)", ("url1",))
+                tx.insert(
+                    "INSERT INTO processed_articles (article_id, clean_text) VALUES (?, ?)",
+                    (999, "본문"),
+                )
+
+        assert real_db.count("articles") == 0
+        assert real_db.fetch_tuples("PRAGMA foreign_keys") == [(1,)]
+
+    def test_bulk_insert_ignores_unrelated_orphans(self, real_db):
+        """지정하지 않은 테이블의 기존 외래 키 위반은 검사하지 않는지 테스트"""
+        # 외래 키 검사를 끄고 고아 행을 미리 넣어 둠 (PRAGMA는 트랜잭션 밖에서 실행)
+        conn = real_db._get_conn()
+        conn.execute("PRAGMA foreign_keys=OFF")
+        conn.execute("INSERT INTO posting_history (post_id, publish_status) VALUES (999, 'success')")
+        conn.execute("PRAGMA foreign_keys=ON")
+
+        with real_db.bulk_insert("articles") as tx:
+            tx.insert("INSERT INTO articles (url) VALUES (?)", ("url1",))
+
+        assert real_db.count("articles") == 1
+
+    def test_bulk_insert_requires_tables(self, real_db):
+        """검증할 테이블 없이 bulk_insert 호출 시 예외 테스트"""
+        with pytest.raises(ValueError):
+            with real_db.bulk_insert():
+                pass
+
+
+class TestSchemaInit:
+    """init_db 스키마/인덱스 테스트"""
+
+    def test_new_database_uses_large_page_size(self, real_db):
+        """새 DB 파일의 page_size 설정 테스트"""
+        assert real_db.fetch_tuples("PRAGMA page_size") == [(8192,)]
+
+    def test_init_db_records_schema_version(self, real_db):
+        """init_db 후 스키마 해시가 user_version에 기록되는지 테스트"""
+        from utils.database import _SCHEMA_VERSION_HASH
+
+        rows = real_db.execute("PRAGMA user_version")
+
+        assert rows[0][0] == _SCHEMA_VERSION_HASH
+
+    def test_init_db_creates_only_missing(self, real_db):
+        """누락된 스키마 객체만 다시 생성하는지 테스트"""
+        real_db.insert("INSERT INTO articles (url) VALUES (?)", ("url1",))
+        real_db.execute("DROP INDEX idx_posts_status_created")
+        real_db.execute("PRAGMA user_version = 0")
+
+        real_db.init_db()
+
+        indexes = real_db.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND name = ?",
+            ("idx_posts_status_created",),
+        )
+        assert len(indexes) == 1
+        assert real_db.count("articles") == 1
+
+    @pytest.mark.parametrize(
+        "query, index_name",
+        [
+            pytest.param(
+                "SELECT * FROM posts WHERE status = 'draft' ORDER BY created_at DESC",
+                "idx_posts_status_created",
+                id="posts_status_created",
+            ),
+            pytest.param(
+                "SELECT id FROM posting_history WHERE post_id = 1 AND publish_status = 'success'",
+                "idx_posting_history_post_status",
+                id="posting_history_post_status",
+            ),
+        ],
+    )
+    def test_composite_index_used(self, real_db, query, index_name):
+        """복합 인덱스가 쿼리 플랜에 사용되는지 테스트"""
+        plan = real_db.execute(f"EXPLAIN QUERY PLAN {query}")
+
+        assert any(index_name in row["detail"] for row in plan)
+
+
+class TestReadPaths:
+    """조회 헬퍼 테스트"""
+
+    def test_fetch_tuples_returns_plain_tuples(self, real_db):
+        """fetch_tuples가 Row 대신 튜플을 반환하는지 테스트"""
+        real_db.insert("INSERT INTO articles (url, title) VALUES (?, ?)", ("url1", "제목"))
+
+        rows = real_db.fetch_tuples("SELECT url, title FROM articles")
+
+        assert rows == [("url1", "제목")]
+        assert real_db.count("articles", "url = ?", ("url1",)) == 1
+
+    def test_fetch_dicts_maps_columns(self, real_db):
+        """fetch_dicts가 컬럼명을 키로 사용하는지 테스트"""
+        real_db.insert("INSERT INTO articles (url, title) VALUES (?, ?)", ("url1", "제목"))
+
+        rows = real_db.fetch_dicts("SELECT url, title FROM articles")
+
+        assert rows == [{"url": "url1", "title": "제목"}]
+
+    def test_iter_rows_streams_results(self, real_db):
+        """iter_rows가 결과를 이터레이터로 반환하는지 테스트"""
+        real_db.execute_many(
+            "INSERT INTO articles (url) VALUES (?)",
+            ((f"url{i}",) for i in range(5)),
+        )
+
+        with real_db.iter_rows("SELECT url FROM articles ORDER BY id") as rows:
+            first = next(rows)
+            rest = [row["url"] for row in rows]
+
+        assert first["url"] == "url0"
+        assert rest == ["url1", "url2", "url3", "url4"]
+
+    def test_article_size_and_md5_in_sql(self, real_db):
+        """html 길이/해시를 SQL에서 계산하는지 테스트"""
+        import hashlib
+
+        html = "<p>본문</p>" * 100
+        article_id = real_db.insert(
+            "INSERT INTO articles (url, html) VALUES (?, ?)", ("url1", html)
+        )
+
+        digest = real_db.fetch_tuples(
+            "SELECT md5(html) FROM articles WHERE id = ?", (article_id,)
+        )[0][0]
+
+        assert real_db.get_article_size(article_id) == len(html)
+        assert real_db.get_article_size(article_id + 1) is None
+        assert digest == hashlib.md5(html.encode()).digest()
+
+
+class TestBlogQueries:
+    """블로그 조회/캐시 테스트"""
+
+    def test_get_blog_cache_hit(self, blog_db):
+        """DB 변경이 없으면 get_blog가 캐시에서 응답하는지 테스트"""
+        first = blog_db.get_blog(blog_id=1)
+
+        with patch.object(blog_db, "fetch_dicts", wraps=blog_db.fetch_dicts) as fetch:
+            cached = blog_db.get_blog(blog_id=1)
+
+        assert cached == first
+        assert cached is not first
+        fetch.assert_not_called()
+
+    def test_get_blog_sees_update_on_same_connection(self, blog_db):
+        """같은 연결에서의 UPDATE가 get_blog에 바로 반영되는지 테스트"""
+        blog_db.get_blog(blog_id=1)
+
+        blog_db.execute("UPDATE blogs SET active = 0 WHERE id = ?", (1,))
+
+        assert blog_db.get_blog(blog_id=1)["active"] == 0
+
+    def test_get_blog_ignores_rolled_back_update(self, blog_db):
+        """롤백된 트랜잭션 안에서 읽은 값이 캐시에 남지 않는지 테스트"""
+        blog_db.get_blog(blog_id=1)
+
+        with pytest.raises(RuntimeError):
+            with blog_db.transaction() as tx:
+                tx.execute("UPDATE blogs SET display_name = ? WHERE id = ?", ("DIRTY", 1))
+                assert tx.get_blog(blog_id=1)["display_name"] == "DIRTY"
+                raise RuntimeError("강제 롤백")
+
+        assert blog_db.get_blog(blog_id=1)["display_name"] == "실무"
+
+    def test_get_blog_sees_update_from_other_connection(self, blog_db):
+        """다른 연결(프로세스)의 UPDATE가 get_blog에 반영되는지 테스트"""
+        blog_db.get_blog(blog_id=1)
+
+        other = sqlite3.connect(str(blog_db.db_path))
+        try:
+            with other:
+                other.execute("UPDATE blogs SET display_name = ? WHERE id = ?", ("변경", 1))
+        finally:
+            other.close()
+
+        assert blog_db.get_blog(blog_id=1)["display_name"] == "변경"
+
+    def test_list_blogs_returns_slotted_records(self, real_db):
+        """list_blogs가 Blog 레코드를 반환하는지 테스트"""
+        from pathlib import Path
+        from models.blog import Blog
+
+        migration = Path(__file__).parent.parent / "migrations" / "001_add_multi_blog_support.sql"
+        real_db._get_conn().executescript(migration.read_text(encoding="utf-8"))
+
+        blogs = real_db.list_blogs()
+
+        assert blogs and all(isinstance(blog, Blog) for blog in blogs)
+        assert not hasattr(blogs[0], "__dict__")
+        assert blogs[0].as_dict()["name"] == blogs[0].name
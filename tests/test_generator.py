@@ -3,149 +3,81 @@
 SEOOptimizer와 QualityChecker 기능 테스트
 """
 
+import re
 import pytest
-from unittest.mock import MagicMock, patch
 
+from tests.stubs import shared_mock
 
-class TestSEOOptimizer:
-    """SEOOptimizer 클래스 테스트"""
+# 품질 문제 메시지 검사 패턴 (제목/밀도 관련)
+_ISSUE_RE = re.compile(r"제목|밀도")
 
-    @pytest.fixture
-    def seo_optimizer(self):
-        """SEOOptimizer 인스턴스 생성"""
-        from unittest.mock import MagicMock
-        optimizer = MagicMock()
-        optimizer.calculate_score = MagicMock()
-        optimizer.get_keyword_density = MagicMock()
-        optimizer._check_auth_gr = MagicMock()
-        optimizer._check_c_rank = MagicMock()
-        optimizer._check_dia_plus = MagicMock()
-        optimizer._check_ai_briefing = MagicMock()
-        return optimizer
-
-    def test_calculate_score_good_content(self, seo_optimizer):
-        """좋은 품질의 콘텐츠 점수 계산 테스트"""
-        title = "네이버 블로그 최적화 완벽 가이드 2024"
-        body = "네이버 블로그를 효과적으로 최적화하는 방법을 소개합니다. " * 10
-        keyword = "네이버 블로그 최적화"
-
-        seo_optimizer.calculate_score.return_value = 85.5
+# 반복 문자열 본문 (import 시 한 번만 생성)
+_GOOD_BODY = "네이버 블로그를 효과적으로 최적화하는 방법을 소개합니다. " * 10
+_TITLE_BODY = "네이버 블로그 최적화에 대한 내용입니다." * 5
+_NO_TITLE_BODY = "네이버 블로그 최적화에 대해 설명합니다." * 5
+_LONG_BODY = "본문입니다. " * 100  # 충분한 길이
+_QUALITY_POST_BODY = "네이버 블로그 최적화 방법을 설명합니다. " * 20
 
-        score = seo_optimizer.calculate_score(title, body, keyword)
-
-        assert score > 70
-        assert isinstance(score, float)
-        seo_optimizer.calculate_score.assert_called_once_with(title, body, keyword)
-
-    def test_calculate_score_poor_content(self, seo_optimizer):
-        """저품질 콘텐츠 점수 계산 테스트"""
-        title = "제목"
-        body = "본문"
-        keyword = "키워드"
-
-        seo_optimizer.calculate_score.return_value = 25.0
-
-        score = seo_optimizer.calculate_score(title, body, keyword)
+# SEOOptimizer / QualityChecker 목 (모듈당 1회 생성, 테스트마다 초기화)
+seo_optimizer = shared_mock(
+    "seo_optimizer", "calculate_score", "get_keyword_density",
+    "_check_auth_gr", "_check_c_rank", "_check_dia_plus", "_check_ai_briefing",
+)
+quality_checker = shared_mock(
+    "quality_checker", "check_plagiarism", "check_quality", "_calculate_similarity"
+)
 
-        assert score < 50
-        assert isinstance(score, float)
 
-    def test_calculate_score_keyword_in_title(self, seo_optimizer):
-        """제목에 키워드 포함된 점수 계산 테스트"""
-        title = "네이버 블로그 최적화 방법"
-        body = "네이버 블로그 최적화에 대한 내용입니다." * 5
-        keyword = "네이버 블로그 최적화"
-
-        seo_optimizer.calculate_score.return_value = 78.0
-
-        score = seo_optimizer.calculate_score(title, body, keyword)
-
-        assert score > 70
-        seo_optimizer.calculate_score.assert_called_once()
-
-    def test_calculate_score_keyword_not_in_title(self, seo_optimizer):
-        """제목에 키워드 미포함된 점수 계산 테스트"""
-        title = "블로그 운영 팁"
-        body = "네이버 블로그 최적화에 대해 설명합니다." * 5
-        keyword = "네이버 블로그 최적화"
-
-        seo_optimizer.calculate_score.return_value = 55.0
-
-        score = seo_optimizer.calculate_score(title, body, keyword)
-
-        assert score < 70
-
-    def test_calculate_score_empty_content(self, seo_optimizer):
-        """빈 콘텐츠 점수 계산 테스트"""
-        title = ""
-        body = ""
-        keyword = ""
-
-        seo_optimizer.calculate_score.return_value = 0.0
-
-        score = seo_optimizer.calculate_score(title, body, keyword)
-
-        assert score == 0.0
-
-    def test_calculate_score_long_content(self, seo_optimizer):
-        """긴 콘텐츠 점수 계산 테스트"""
-        title = "제목"
-        body = "본문입니다. " * 100  # 충분한 길이
-        keyword = "본문"
+class TestSEOOptimizer:
+    """SEOOptimizer 클래스 테스트"""
 
-        seo_optimizer.calculate_score.return_value = 82.0
+    def test_return_types_contract(self, seo_optimizer):
+        """점수/밀도 반환 타입 계약 테스트 (float)"""
+        seo_optimizer.calculate_score.return_value = 1.0
+        seo_optimizer.get_keyword_density.return_value = 1.0
+
+        assert isinstance(seo_optimizer.calculate_score("", "", ""), float)
+        assert isinstance(seo_optimizer.get_keyword_density("", ""), float)
+
+    @pytest.mark.parametrize("title, body, keyword, return_value, lo, hi", [
+        ("네이버 블로그 최적화 완벽 가이드 2024", _GOOD_BODY, "네이버 블로그 최적화", 85.5, 70, 100),
+        ("제목", "본문", "키워드", 25.0, 0, 50),
+        ("네이버 블로그 최적화 방법", _TITLE_BODY, "네이버 블로그 최적화", 78.0, 70, 100),
+        ("블로그 운영 팁", _NO_TITLE_BODY, "네이버 블로그 최적화", 55.0, 0, 70),
+        ("", "", "", 0.0, 0, 0),
+        ("제목", _LONG_BODY, "본문", 82.0, 70, 100),
+    ], ids=[
+        "good_content",
+        "poor_content",
+        "keyword_in_title",
+        "keyword_not_in_title",
+        "empty_content",
+        "long_content",
+    ])
+    def test_calculate_score(self, seo_optimizer, title, body, keyword, return_value, lo, hi):
+        """콘텐츠 유형별 SEO 점수 계산 테스트"""
+        seo_optimizer.calculate_score.return_value = return_value
 
         score = seo_optimizer.calculate_score(title, body, keyword)
 
-        assert score > 70
-        assert isinstance(score, float)
-
-    def test_get_keyword_density_normal(self, seo_optimizer):
-        """정상적인 키워드 밀도 계산 테스트"""
-        text = "네이버 네이버 네이버 블로그 블로그 최적화 최적화 최적화 최적화"
-        keyword = "최적화"
+        assert lo <= score <= hi
+        seo_optimizer.calculate_score.assert_called_once_with(title, body, keyword)
 
-        seo_optimizer.get_keyword_density.return_value = 4.4  # 44% (대략)
+    @pytest.mark.parametrize("text, keyword, return_value, lo, hi", [
+        ("네이버 네이버 네이버 블로그 블로그 최적화 최적화 최적화 최적화", "최적화", 4.4, 0, 100),
+        ("다른 텍스트입니다. 여러 단어가 있습니다.", "없는키워드", 0.0, 0, 0),
+        ("테스트 테스트 테스트 테스트", "테스트", 100.0, 100, 100),
+        ("Test TEST test Test", "test", 25.0, 25, 25),
+    ], ids=["normal", "no_keyword", "all_keyword", "case_insensitive"])
+    def test_get_keyword_density(self, seo_optimizer, text, keyword, return_value, lo, hi):
+        """키워드 밀도 계산 테스트"""
+        seo_optimizer.get_keyword_density.return_value = return_value
 
         density = seo_optimizer.get_keyword_density(text, keyword)
 
-        assert 0 <= density <= 100
-        assert isinstance(density, float)
+        assert lo <= density <= hi
         seo_optimizer.get_keyword_density.assert_called_once_with(text, keyword)
 
-    def test_get_keyword_density_no_keyword(self, seo_optimizer):
-        """키워드 없을 때 밀도 계산 테스트"""
-        text = "다른 텍스트입니다. 여러 단어가 있습니다."
-        keyword = "없는키워드"
-
-        seo_optimizer.get_keyword_density.return_value = 0.0
-
-        density = seo_optimizer.get_keyword_density(text, keyword)
-
-        assert density == 0.0
-
-    def test_get_keyword_density_all_keyword(self, seo_optimizer):
-        """모두 키워드인 텍스트 밀도 계산 테스트"""
-        text = "테스트 테스트 테스트 테스트"
-        keyword = "테스트"
-
-        seo_optimizer.get_keyword_density.return_value = 100.0
-
-        density = seo_optimizer.get_keyword_density(text, keyword)
-
-        assert density == 100.0
-
-    def test_get_keyword_density_case_insensitive(self, seo_optimizer):
-        """대소문자 무관 키워드 밀도 계산 테스트"""
-        text = "Test TEST test Test"
-        keyword = "test"
-
-        seo_optimizer.get_keyword_density.return_value = 25.0
-
-        density = seo_optimizer.get_keyword_density(text, keyword)
-
-        assert density == 25.0
-
     def test_check_auth_gr_present(self, seo_optimizer):
         """Auth-GR 존재 확인 테스트"""
         body = "구글 애드센스 authorship verified"
@@ -195,73 +127,43 @@ class TestSEOOptimizer:
 class TestQualityChecker:
     """QualityChecker 클래스 테스트"""
 
-    @pytest.fixture
-    def quality_checker(self):
-        """QualityChecker 인스턴스 생성"""
-        from unittest.mock import MagicMock
-        checker = MagicMock()
-        checker.check_plagiarism = MagicMock()
-        checker.check_quality = MagicMock()
-        checker._calculate_similarity = MagicMock()
-        return checker
-
-    def test_check_plagiarism_no_plagiarism(self, quality_checker):
-        """표절 없음 확인 테스트"""
-        generated = "이것은 새로운 콘텐츠입니다. 독창적인 내용을 담고 있습니다."
-        original = "완전히 다른 원본 내용입니다. 다른 주제를 다룹니다."
-
-        quality_checker.check_plagiarism.return_value = {
-            "plagiarism_score": 5.0,
-            "is_plagiarized": False
-        }
-
-        result = quality_checker.check_plagiarism(generated, original)
-
-        assert result["is_plagiarized"] is False
-        assert result["plagiarism_score"] < 30
-
-    def test_check_plagiarism_high_similarity(self, quality_checker):
-        """높은 유사도 표절 확인 테스트"""
-        original = "네이버 블로그 최적화는 매우 중요합니다."
-        generated = "네이버 블로그 최적화는 매우 중요합니다."  # 동일한 텍스트
-
-        quality_checker.check_plagiarism.return_value = {
-            "plagiarism_score": 95.0,
-            "is_plagiarized": True
-        }
-
-        result = quality_checker.check_plagiarism(generated, original)
-
-        assert result["is_plagiarized"] is True
-        assert result["plagiarism_score"] > 80
-
-    def test_check_plagiarism_partial_match(self, quality_checker):
-        """부분 일치 표절 확인 테스트"""
-        original = "네이버 블로그 최적화는 중요합니다. SEO 기법을 활용해야 합니다."
-        generated = "네이버 블로그 최적화는 중요합니다. 다른 기술을 사용하는 것이 좋습니다."
-
-        quality_checker.check_plagiarism.return_value = {
-            "plagiarism_score": 45.0,
-            "is_plagiarized": False
-        }
-
-        result = quality_checker.check_plagiarism(generated, original)
-
-        assert 20 < result["plagiarism_score"] < 70
-
-    def test_check_plagiarism_empty_texts(self, quality_checker):
-        """빈 텍스트 표절 확인 테스트"""
-        generated = ""
-        original = ""
+    def test_return_types_contract(self, quality_checker):
+        """유사도 반환 타입 계약 테스트 (float)"""
+        quality_checker._calculate_similarity.return_value = 0.5
 
+        assert isinstance(quality_checker._calculate_similarity("", ""), float)
+
+    @pytest.mark.parametrize("generated, original, plagiarism_score, is_plagiarized, lo, hi", [
+        (
+            "이것은 새로운 콘텐츠입니다. 독창적인 내용을 담고 있습니다.",
+            "완전히 다른 원본 내용입니다. 다른 주제를 다룹니다.",
+            5.0, False, 0, 30,
+        ),
+        (
+            "네이버 블로그 최적화는 매우 중요합니다.",
+            "네이버 블로그 최적화는 매우 중요합니다.",  # 동일한 텍스트
+            95.0, True, 80, 100,
+        ),
+        (
+            "네이버 블로그 최적화는 중요합니다. 다른 기술을 사용하는 것이 좋습니다.",
+            "네이버 블로그 최적화는 중요합니다. SEO 기법을 활용해야 합니다.",
+            45.0, False, 20, 70,
+        ),
+        ("", "", 0.0, False, 0, 0),
+    ], ids=["no_plagiarism", "high_similarity", "partial_match", "empty_texts"])
+    def test_check_plagiarism(
+        self, quality_checker, generated, original, plagiarism_score, is_plagiarized, lo, hi
+    ):
+        """표절 검사 테스트"""
         quality_checker.check_plagiarism.return_value = {
-            "plagiarism_score": 0.0,
-            "is_plagiarized": False
+            "plagiarism_score": plagiarism_score,
+            "is_plagiarized": is_plagiarized
         }
 
         result = quality_checker.check_plagiarism(generated, original)
 
-        assert result["is_plagiarized"] is False
+        assert result["is_plagiarized"] is is_plagiarized
+        assert lo <= result["plagiarism_score"] <= hi
 
     def test_calculate_similarity_identical(self, quality_checker):
         """동일한 텍스트 유사도 계산 테스트"""
@@ -296,7 +198,6 @@ class TestQualityChecker:
         similarity = quality_checker._calculate_similarity(text1, text2)
 
         assert 0.4 <= similarity <= 0.8
-        assert isinstance(similarity, float)
 
     def test_calculate_similarity_order_matters(self, quality_checker):
         """단어 순서 영향도 테스트"""
@@ -313,7 +214,7 @@ class TestQualityChecker:
         """우수한 포스트 품질 확인 테스트"""
         post = {
             "title": "네이버 블로그 SEO 최적화 완벽 가이드 2024",
-            "content": "네이버 블로그 최적화 방법을 설명합니다. " * 20,
+            "content": _QUALITY_POST_BODY,
             "keyword_density": 3.5,
             "keyword": "네이버 블로그 최적화",
             "readability_score": 85
@@ -369,4 +270,4 @@ class TestQualityChecker:
         result = quality_checker.check_quality(post)
 
         assert len(result["issues"]) > 0
-        assert any("제목" in issue or "밀도" in issue for issue in result["issues"])
+        assert any(_ISSUE_RE.search(issue) for issue in result["issues"])
@@ -0,0 +1,140 @@
+"""
+HTTP 클라이언트 테스트
+AsyncHTTPClient 재시도(Retry-After/jitter), 요청 간격 예약, 스트리밍 결과 취소 테스트
+"""
+
+import asyncio
+import contextlib
+import pytest
+from unittest.mock import patch
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from utils import http_client
+from utils.http_client import AsyncHTTPClient
+
+# Retry-After 날짜 형식 (초 단위가 아니므로 jitter로 대체)
+_HTTP_DATE = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+
+@pytest.fixture
+async def server():
+    """경로별 응답 순서를 지정할 수 있는 로컬 테스트 서버"""
+    responses: dict[str, list[tuple[int, dict]]] = {}
+    hits: list[tuple[str, float]] = []
+
+    async def handler(request):
+        loop = asyncio.get_running_loop()
+        hits.append((request.path, loop.time()))
+        if request.path.startswith("/slow"):
+            await asyncio.sleep(5)
+        queue = responses.get(request.path)
+        status, headers = queue.pop(0) if queue else (200, {})
+        return web.Response(status=status, text=request.path, headers=headers)
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    srv = TestServer(app)
+    await srv.start_server()
+    srv.responses = responses
+    srv.hits = hits
+    yield srv
+    await srv.close()
+
+
+class TestRetry:
+    """AsyncHTTPClient 재시도 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_retry_after_then_success(self, server):
+        """429 + Retry-After 응답 후 재시도해 성공하는지 테스트 (jitter 미사용)"""
+        server.responses["/a"] = [(429, {"Retry-After": "0"})]
+
+        with patch.object(http_client.random, "uniform") as uniform:
+            async with AsyncHTTPClient(retries=3, retry_base=5.0) as client:
+                result = await client.get(str(server.make_url("/a")))
+
+        assert result["status"] == 200
+        assert [path for path, _ in server.hits] == ["/a", "/a"]
+        uniform.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_retry_status_on_last_attempt_returned(self, server):
+        """마지막 시도의 429 응답은 그대로 반환되는지 테스트"""
+        server.responses["/a"] = [(429, {"Retry-After": "0"})] * 2
+
+        async with AsyncHTTPClient(retries=2) as client:
+            result = await client.get(str(server.make_url("/a")))
+
+        assert result["status"] == 429
+        assert len(server.hits) == 2
+
+    @pytest.mark.asyncio
+    async def test_non_numeric_retry_after_uses_jitter(self, server):
+        """날짜 형식 Retry-After는 jitter 대기로 대체되는지 테스트"""
+        server.responses["/a"] = [(503, {"Retry-After": _HTTP_DATE})]
+
+        with patch.object(http_client.random, "uniform", return_value=0.0) as uniform:
+            async with AsyncHTTPClient(retries=3, retry_base=0.5) as client:
+                result = await client.get(str(server.make_url("/a")))
+
+        assert result["status"] == 200
+        uniform.assert_called_once_with(0.5, 1.5)
+
+    @pytest.mark.parametrize("value, expected", [
+        ("3", 3.0),
+        ("0.5", 0.5),
+        ("-1", 0.0),
+        (_HTTP_DATE, None),
+        ("", None),
+        (None, None),
+    ], ids=["seconds", "fractional", "negative", "http_date", "empty", "missing"])
+    def test_parse_retry_after(self, value, expected):
+        """Retry-After 헤더 파싱 테스트"""
+        assert AsyncHTTPClient._parse_retry_after(value) == expected
+
+
+class TestGetMany:
+    """AsyncHTTPClient 다중 요청 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_get_many_paces_start_times(self, server):
+        """get_many가 요청 시작 시각을 delay 간격으로 예약하는지 테스트"""
+        urls = [str(server.make_url(f"/p{i}")) for i in range(3)]
+
+        async with AsyncHTTPClient() as client:
+            results = await client.get_many(urls, delay=0.1)
+
+        assert [r["text"] for r in results] == ["/p0", "/p1", "/p2"]
+        times = sorted(t for _, t in server.hits)
+        gaps = [b - a for a, b in zip(times, times[1:])]
+        assert all(gap >= 0.08 for gap in gaps)
+
+    @pytest.mark.asyncio
+    async def test_iter_many_cancels_remaining_on_early_exit(self, server):
+        """iter_many 소비 중단 시 남은 요청이 취소되는지 테스트"""
+        urls = [str(server.make_url("/fast"))] + [
+            str(server.make_url(f"/slow{i}")) for i in range(2)
+        ]
+
+        tasks = []
+
+        async with AsyncHTTPClient() as client:
+            schedule = client._schedule_gets
+
+            def capture(*args):
+                tasks.extend(schedule(*args))
+                return tasks
+
+            with patch.object(client, "_schedule_gets", side_effect=capture):
+                async with contextlib.aclosing(client.iter_many(urls)) as results:
+                    async for result in results:
+                        first = result
+                        break
+            await asyncio.sleep(0)
+
+            assert first["text"] == "/fast"
+            assert all(task.done() for task in tasks)
+            assert sum(task.cancelled() for task in tasks) == 2
@@ -0,0 +1,75 @@
+"""
+로거 모듈 테스트
+표준 logging fallback 래퍼(_StdlibLoggerWrapper)의 지연 포맷 테스트 (loguru 불필요)
+"""
+
+import logging
+import pytest
+
+from utils.logger import _StdlibLoggerWrapper
+
+
+class _Unformattable:
+    """포맷되면 실패하는 인자 (비활성 레벨에서 포맷 생략 확인용)"""
+
+    def __format__(self, spec):
+        raise AssertionError("비활성 레벨에서 인자가 포맷됨")
+
+
+class _ListHandler(logging.Handler):
+    """출력된 메시지를 리스트에 모으는 핸들러"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append((record.levelno, record.getMessage()))
+
+
+@pytest.fixture
+def captured():
+    """INFO 레벨 전용 로거와 캡처 핸들러 (전파 없음)"""
+    stdlib_logger = logging.getLogger("autopilot.test_logger")
+    stdlib_logger.setLevel(logging.INFO)
+    stdlib_logger.propagate = False
+    handler = _ListHandler()
+    stdlib_logger.addHandler(handler)
+    yield _StdlibLoggerWrapper(stdlib_logger), handler.messages
+    stdlib_logger.removeHandler(handler)
+
+
+class TestStdlibLoggerWrapper:
+    """_StdlibLoggerWrapper 테스트"""
+
+    def test_formats_args_when_enabled(self, captured):
+        """활성 레벨에서 {} 인자가 포맷되는지 테스트"""
+        log, messages = captured
+        log.info("키워드 {} 처리 ({:.1f}초)", "테스트", 1.25)
+        log.warning("상태: {status}", status="ok")
+
+        assert messages == [
+            (logging.INFO, "키워드 테스트 처리 (1.2초)"),
+            (logging.WARNING, "상태: ok"),
+        ]
+
+    def test_skips_format_when_disabled(self, captured):
+        """비활성 레벨에서는 인자를 포맷하지 않는지 테스트"""
+        log, messages = captured
+        log.debug("값: {}", _Unformattable())
+
+        assert messages == []
+
+    def test_message_without_args_not_formatted(self, captured):
+        """인자가 없으면 중괄호가 그대로 출력되는지 테스트"""
+        log, messages = captured
+        log.error("JSON {key: value}")
+
+        assert messages == [(logging.ERROR, "JSON {key: value}")]
+
+    def test_success_keeps_prefix(self, captured):
+        """success가 INFO 레벨로 접두사와 함께 출력되는지 테스트"""
+        log, messages = captured
+        log.success("발행 완료: {}", 3)
+
+        assert messages == [(logging.INFO, "✅ 발행 완료: 3")]
@@ -4,253 +4,193 @@ ReportGenerator 기능 테스트
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
-from datetime import datetime, timedelta
-
-
-class TestReportGenerator:
-    """ReportGenerator 클래스 테스트"""
-
-    @pytest.fixture
-    def report_generator(self, temp_db):
-        """ReportGenerator 인스턴스 생성"""
-        from unittest.mock import MagicMock
-        generator = MagicMock()
-        generator.db = temp_db
-        generator.generate_weekly_report = MagicMock()
-        generator.generate_monthly_report = MagicMock()
-        generator._get_period_stats = MagicMock()
-        generator._format_markdown = MagicMock()
-        return generator
-
-    def test_get_period_stats_weekly(self, report_generator, sample_posting_history, temp_db):
-        """주간 통계 조회 테스트"""
-        # 일주일 간의 포스팅 통계
-        stats = {
-            "period": "2024-01-01 ~ 2024-01-07",
-            "total_posts": 3,
-            "successful_posts": 3,
-            "failed_posts": 0,
-            "avg_views": 150,
-            "total_engagement": 450,
-            "most_popular_keyword": "테스트 키워드"
-        }
-
-        report_generator._get_period_stats.return_value = stats
-
-        result = report_generator._get_period_stats("week")
-
-        assert result["period"] is not None
-        assert result["total_posts"] >= 0
-        assert result["successful_posts"] >= 0
-        report_generator._get_period_stats.assert_called_once_with("week")
-
-    def test_get_period_stats_monthly(self, report_generator):
-        """월간 통계 조회 테스트"""
-        stats = {
-            "period": "2024-01월",
-            "total_posts": 15,
-            "successful_posts": 14,
-            "failed_posts": 1,
-            "avg_views": 200,
-            "total_engagement": 3000,
-            "growth_rate": 15.5
-        }
-
-        report_generator._get_period_stats.return_value = stats
-
-        result = report_generator._get_period_stats("month")
-
-        assert "period" in result
-        assert result["total_posts"] > 0
-        assert result["successful_posts"] <= result["total_posts"]
-
-    def test_get_period_stats_includes_metrics(self, report_generator):
-        """통계에 필수 메트릭 포함 테스트"""
-        required_metrics = [
-            "period",
-            "total_posts",
-            "successful_posts",
-            "failed_posts"
-        ]
-
-        stats = {
-            "period": "2024-01-01 ~ 2024-01-07",
-            "total_posts": 10,
-            "successful_posts": 9,
-            "failed_posts": 1,
-            "avg_views": 100,
-            "engagement_rate": 0.85
-        }
-
-        report_generator._get_period_stats.return_value = stats
-
-        result = report_generator._get_period_stats("week")
-
-        for metric in required_metrics:
-            assert metric in result
-
-    def test_get_period_stats_zero_posts(self, report_generator):
-        """포스트가 없는 기간 통계 테스트"""
-        stats = {
+from collections.abc import Mapping
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock
+
+from tests.stubs import Stub
+
+# ReportGenerator 목에서 사용하는 메서드 이름
+_REPORT_GENERATOR_METHODS = (
+    "generate_weekly_report",
+    "generate_monthly_report",
+    "_get_period_stats",
+    "_format_markdown",
+)
+
+# 공용 통계 템플릿 (읽기 전용, import 시 한 번만 생성)
+_WEEKLY_STATS_TEMPLATE = MappingProxyType({
+    "period": "2024-01-01 ~ 2024-01-07",
+    "total_posts": 3,
+    "successful_posts": 3,
+    "failed_posts": 0,
+    "avg_views": 150,
+    "total_engagement": 450,
+    "most_popular_keyword": "테스트 키워드"
+})
+_MONTHLY_STATS_TEMPLATE = MappingProxyType({
+    "period": "2024-01월",
+    "total_posts": 15,
+    "successful_posts": 14,
+    "failed_posts": 1,
+    "avg_views": 200,
+    "total_engagement": 3000,
+    "growth_rate": 15.5
+})
+
+# _get_period_stats 테스트 케이스: (기간 종류, 통계, 필수 키, 추가 검증)
+_PERIOD_STATS_CASES = [
+    pytest.param(
+        "week",
+        _WEEKLY_STATS_TEMPLATE,
+        ("period", "total_posts", "successful_posts"),
+        lambda r: r["period"] is not None and r["total_posts"] >= 0 and r["successful_posts"] >= 0,
+        id="weekly",
+    ),
+    pytest.param(
+        "month",
+        _MONTHLY_STATS_TEMPLATE,
+        ("period", "total_posts", "successful_posts"),
+        lambda r: 0 < r["total_posts"] and r["successful_posts"] <= r["total_posts"],
+        id="monthly",
+    ),
+    pytest.param(
+        "week",
+        {**_WEEKLY_STATS_TEMPLATE, "total_posts": 10, "successful_posts": 9, "failed_posts": 1},
+        ("period", "total_posts", "successful_posts", "failed_posts"),
+        None,
+        id="includes_metrics",
+    ),
+    pytest.param(
+        "week",
+        {
             "period": "2024-02-01 ~ 2024-02-07",
             "total_posts": 0,
             "successful_posts": 0,
             "failed_posts": 0,
             "avg_views": 0,
             "message": "이 기간에 발행된 포스트가 없습니다"
-        }
-
-        report_generator._get_period_stats.return_value = stats
-
-        result = report_generator._get_period_stats("week")
-
-        assert result["total_posts"] == 0
-
-    def test_get_period_stats_with_errors(self, report_generator):
-        """오류 정보 포함된 통계 테스트"""
-        stats = {
-            "period": "2024-01-01 ~ 2024-01-07",
+        },
+        ("total_posts",),
+        lambda r: r["total_posts"] == 0,
+        id="zero_posts",
+    ),
+    pytest.param(
+        "week",
+        {
+            **_WEEKLY_STATS_TEMPLATE,
             "total_posts": 5,
             "successful_posts": 4,
             "failed_posts": 1,
             "errors": [
                 {"post_id": 3, "error": "네트워크 오류"}
             ]
-        }
-
-        report_generator._get_period_stats.return_value = stats
-
-        result = report_generator._get_period_stats("week")
-
-        assert result["failed_posts"] > 0
-        assert "errors" in result
-
-    def test_format_markdown_basic(self, report_generator):
-        """기본 마크다운 포맷팅 테스트"""
-        stats = {
-            "period": "2024-01-01 ~ 2024-01-07",
-            "total_posts": 3,
-            "successful_posts": 3,
-            "failed_posts": 0,
-            "avg_views": 150
-        }
-
-        markdown = "# 주간 리포트\n## 기간: 2024-01-01 ~ 2024-01-07\n- 총 포스트: 3"
-
-        report_generator._format_markdown.return_value = markdown
-
-        result = report_generator._format_markdown(stats, "week")
-
-        assert result is not None
-        assert isinstance(result, str)
-        assert "#" in result  # 마크다운 헤더 포함
-        report_generator._format_markdown.assert_called_once()
-
-    def test_format_markdown_includes_title(self, report_generator):
-        """마크다운이 제목을 포함하는 테스트"""
-        stats = {"period": "2024-01-01 ~ 2024-01-07", "total_posts": 5}
-
-        markdown = "# 주간 리포트\n내용..."
-
-        report_generator._format_markdown.return_value = markdown
-
-        result = report_generator._format_markdown(stats, "week")
-
-        assert "리포트" in result or "Report" in result
-
-    def test_format_markdown_includes_stats(self, report_generator):
-        """마크다운이 통계를 포함하는 테스트"""
-        stats = {
+        },
+        ("failed_posts", "errors"),
+        lambda r: r["failed_posts"] > 0,
+        id="with_errors",
+    ),
+    pytest.param(
+        "month",
+        {"period": "2024-01", "posts": 10},
+        ("period",),
+        lambda r: isinstance(r, dict),
+        id="returns_dict",
+    ),
+]
+
+# _format_markdown 테스트 케이스: (통계, 마크다운, 포함되어야 할 문자열)
+_FORMAT_MARKDOWN_CASES = [
+    pytest.param(
+        _WEEKLY_STATS_TEMPLATE,
+        "# 주간 리포트\n## 기간: 2024-01-01 ~ 2024-01-07\n- 총 포스트: 3",
+        "#",  # 마크다운 헤더 포함
+        id="basic",
+    ),
+    pytest.param(
+        {"period": "2024-01-01 ~ 2024-01-07", "total_posts": 5},
+        "# 주간 리포트\n내용...",
+        "리포트",
+        id="includes_title",
+    ),
+    pytest.param(
+        {
             "period": "2024-01-01 ~ 2024-01-07",
             "total_posts": 5,
             "successful_posts": 4,
             "failed_posts": 1
-        }
-
-        markdown = "# 주간 리포트\n- 총 포스트: 5\n- 성공: 4\n- 실패: 1"
-
-        report_generator._format_markdown.return_value = markdown
-
-        result = report_generator._format_markdown(stats, "week")
-
-        # 통계 수치가 포함되어 있는지 확인
-        assert "5" in result or "포스트" in result
-
-    def test_format_markdown_with_tables(self, report_generator):
-        """마크다운 테이블 형식 테스트"""
-        stats = {
+        },
+        "# 주간 리포트\n- 총 포스트: 5\n- 성공: 4\n- 실패: 1",
+        "5",  # 통계 수치 포함
+        id="includes_stats",
+    ),
+    pytest.param(
+        {
             "period": "2024-01-01 ~ 2024-01-07",
             "daily_breakdown": [
                 {"date": "2024-01-01", "posts": 1, "views": 100},
                 {"date": "2024-01-02", "posts": 1, "views": 120}
             ]
-        }
-
-        markdown = "| 날짜 | 포스트 | 조회수 |\n|------|--------|--------|\n| 2024-01-01 | 1 | 100 |"
-
-        report_generator._format_markdown.return_value = markdown
-
-        result = report_generator._format_markdown(stats, "week")
-
-        assert "|" in result  # 테이블 구문 포함
-
-    def test_generate_weekly_report(self, report_generator, sample_posting_history):
-        """주간 리포트 생성 테스트"""
-        report = {
+        },
+        "| 날짜 | 포스트 | 조회수 |\n|------|--------|--------|\n| 2024-01-01 | 1 | 100 |",
+        "|",  # 테이블 구문 포함
+        id="with_tables",
+    ),
+    pytest.param(
+        {},
+        "# 리포트\n데이터가 없습니다.",
+        "데이터가 없습니다",
+        id="empty_stats",
+    ),
+    pytest.param(
+        {"period": "2024-01", "posts": 10},
+        "# 리포트\n내용",
+        "내용",
+        id="returns_string",
+    ),
+]
+
+# generate_weekly_report 테스트 케이스: (리포트, 필수 키)
+_WEEKLY_REPORT_CASES = [
+    pytest.param(
+        {
             "type": "weekly",
             "period": "2024-01-01 ~ 2024-01-07",
             "total_posts": 3,
             "successful_posts": 3,
             "failed_posts": 0,
             "content": "# 주간 리포트\n..."
-        }
-
-        report_generator.generate_weekly_report.return_value = report
-
-        result = report_generator.generate_weekly_report()
-
-        assert result["type"] == "weekly"
-        assert "content" in result
-        assert isinstance(result["content"], str)
-        report_generator.generate_weekly_report.assert_called_once()
-
-    def test_generate_weekly_report_includes_period(self, report_generator):
-        """주간 리포트에 기간 포함 테스트"""
-        report = {
+        },
+        ("type", "content"),
+        id="basic",
+    ),
+    pytest.param(
+        {
             "type": "weekly",
             "period": "2024-01-01 ~ 2024-01-07",
             "content": "..."
-        }
-
-        report_generator.generate_weekly_report.return_value = report
-
-        result = report_generator.generate_weekly_report()
-
-        assert "period" in result
-        assert "~" in result["period"]
-
-    def test_generate_weekly_report_includes_stats(self, report_generator):
-        """주간 리포트에 통계 포함 테스트"""
-        report = {
+        },
+        ("period",),
+        id="includes_period",
+    ),
+    pytest.param(
+        {
             "type": "weekly",
             "period": "2024-01-01 ~ 2024-01-07",
             "total_posts": 5,
             "successful_posts": 5,
             "failed_posts": 0,
             "content": "# 주간 리포트\n..."
-        }
-
-        report_generator.generate_weekly_report.return_value = report
-
-        result = report_generator.generate_weekly_report()
-
-        assert "total_posts" in result
-        assert result["total_posts"] >= 0
-
-    def test_generate_monthly_report(self, report_generator):
-        """월간 리포트 생성 테스트"""
-        report = {
+        },
+        ("total_posts",),
+        id="includes_stats",
+    ),
+]
+
+# generate_monthly_report 테스트 케이스: (리포트, 필수 키)
+_MONTHLY_REPORT_CASES = [
+    pytest.param(
+        {
             "type": "monthly",
             "period": "2024-01월",
             "total_posts": 15,
@@ -258,36 +198,22 @@ class TestReportGenerator:
             "failed_posts": 1,
             "growth_rate": 15.5,
             "content": "# 월간 리포트\n..."
-        }
-
-        report_generator.generate_monthly_report.return_value = report
-
-        result = report_generator.generate_monthly_report()
-
-        assert result["type"] == "monthly"
-        assert "content" in result
-        assert "growth_rate" in result
-        report_generator.generate_monthly_report.assert_called_once()
-
-    def test_generate_monthly_report_includes_growth(self, report_generator):
-        """월간 리포트에 성장률 포함 테스트"""
-        report = {
+        },
+        ("type", "content", "growth_rate"),
+        id="basic",
+    ),
+    pytest.param(
+        {
             "type": "monthly",
             "period": "2024-01월",
             "growth_rate": 25.5,
             "content": "..."
-        }
-
-        report_generator.generate_monthly_report.return_value = report
-
-        result = report_generator.generate_monthly_report()
-
-        assert "growth_rate" in result
-        assert isinstance(result["growth_rate"], (int, float))
-
-    def test_generate_monthly_report_includes_top_keywords(self, report_generator):
-        """월간 리포트에 상위 키워드 포함 테스트"""
-        report = {
+        },
+        ("growth_rate",),
+        id="includes_growth",
+    ),
+    pytest.param(
+        {
             "type": "monthly",
             "period": "2024-01월",
             "top_keywords": [
@@ -295,73 +221,115 @@ class TestReportGenerator:
                 {"keyword": "SEO 최적화", "posts": 2, "avg_rank": 8}
             ],
             "content": "..."
-        }
+        },
+        ("top_keywords",),
+        id="includes_top_keywords",
+    ),
+]
 
-        report_generator.generate_monthly_report.return_value = report
 
-        result = report_generator.generate_monthly_report()
+class TestReportGenerator:
+    """ReportGenerator 클래스 테스트"""
 
-        assert "top_keywords" in result
-        assert len(result["top_keywords"]) > 0
+    @pytest.fixture(scope="module")
+    def _report_generator_proto(self):
+        """ReportGenerator 목 메서드 묶음 (모듈당 1회 생성)"""
+        return SimpleNamespace(**{name: Stub() for name in _REPORT_GENERATOR_METHODS})
 
-    def test_report_contains_markdown_content(self, report_generator):
-        """리포트에 마크다운 형식의 콘텐츠 포함 테스트"""
-        report = {
-            "type": "weekly",
-            "content": "# 주간 리포트\n## 통계\n- 포스트 수: 5\n- 성공률: 100%"
-        }
+    @pytest.fixture
+    def report_generator(self, _report_generator_proto):
+        """ReportGenerator 인스턴스 (테스트마다 호출 기록/반환값 초기화)"""
+        for name in _REPORT_GENERATOR_METHODS:
+            getattr(_report_generator_proto, name).reset_mock(return_value=True, side_effect=True)
+        return _report_generator_proto
+
+    @pytest.mark.parametrize("method, args", [
+        ("_get_period_stats", ("week",)),
+        ("_format_markdown", ({}, "week")),
+        ("generate_weekly_report", ()),
+        ("generate_monthly_report", ()),
+    ])
+    def test_mock_contract_called_once_with(self, report_generator, method, args):
+        """메서드별 호출 인자 전달 계약 테스트"""
+        mock_method = getattr(report_generator, method)
+
+        mock_method(*args)
+
+        mock_method.assert_called_once_with(*args)
+
+    @pytest.mark.parametrize("period_kind, stats, required_keys, check", _PERIOD_STATS_CASES)
+    def test_get_period_stats(self, report_generator, period_kind, stats, required_keys, check):
+        """기간별 통계 조회 테스트"""
+        report_generator._get_period_stats.return_value = stats
 
-        report_generator.generate_weekly_report.return_value = report
+        result = report_generator._get_period_stats(period_kind)
 
-        result = report_generator.generate_weekly_report()
+        assert isinstance(result, Mapping)
+        assert all(key in result for key in required_keys)
+        if check is not None:
+            assert check(result)
 
-        assert "#" in result["content"]  # 마크다운 헤더
-        assert "-" in result["content"]  # 마크다운 리스트
+    @pytest.mark.parametrize("stats, markdown, needle", _FORMAT_MARKDOWN_CASES)
+    def test_format_markdown(self, report_generator, stats, markdown, needle):
+        """마크다운 포맷팅 테스트"""
+        report_generator._format_markdown.return_value = markdown
 
-    def test_report_timestamp(self, report_generator):
-        """리포트 생성 시간 확인 테스트"""
-        now = datetime.now()
+        result = report_generator._format_markdown(stats, "week")
 
-        report = {
-            "type": "weekly",
-            "generated_at": now.isoformat(),
-            "content": "..."
-        }
+        assert isinstance(result, str)
+        assert needle in result
 
+    @pytest.mark.parametrize("report, keys", _WEEKLY_REPORT_CASES)
+    def test_generate_weekly_report(self, report_generator, report, keys):
+        """주간 리포트 생성 테스트"""
         report_generator.generate_weekly_report.return_value = report
 
         result = report_generator.generate_weekly_report()
 
-        assert "generated_at" in result
-
-    def test_format_markdown_empty_stats(self, report_generator):
-        """빈 통계의 마크다운 포맷팅 테스트"""
-        empty_stats = {}
+        assert result["type"] == "weekly"
+        assert isinstance(result["content"], str)
+        assert "~" in result["period"]
+        for key in keys:
+            assert key in result
 
-        markdown = "# 리포트\n데이터가 없습니다."
+    @pytest.mark.parametrize("report, keys", _MONTHLY_REPORT_CASES)
+    def test_generate_monthly_report(self, report_generator, report, keys):
+        """월간 리포트 생성 테스트"""
+        report_generator.generate_monthly_report.return_value = report
 
-        report_generator._format_markdown.return_value = markdown
+        result = report_generator.generate_monthly_report()
 
-        result = report_generator._format_markdown(empty_stats, "week")
+        assert result["type"] == "monthly"
+        assert isinstance(result["content"], str)
+        for key in keys:
+            assert key in result
 
-        assert result is not None
-        assert isinstance(result, str)
 
-    def test_get_period_stats_returns_dict(self, report_generator):
-        """통계가 딕셔너리를 반환하는 테스트"""
-        report_generator._get_period_stats.return_value = {"period": "2024-01", "posts": 10}
+class TestReportGeneratorSmoke:
+    """픽스처 없이 로컬 목만 사용하는 ReportGenerator 스모크 테스트"""
 
-        result = report_generator._get_period_stats("month")
+    def test_report_contains_markdown_content(self):
+        """리포트에 마크다운 형식의 콘텐츠 포함 테스트"""
+        generator = MagicMock()
+        generator.generate_weekly_report.return_value = {
+            "type": "weekly",
+            "content": "# 주간 리포트\n## 통계\n- 포스트 수: 5\n- 성공률: 100%"
+        }
 
-        assert isinstance(result, dict)
+        result = generator.generate_weekly_report()
 
-    def test_format_markdown_returns_string(self, report_generator):
-        """마크다운 포맷팅이 문자열을 반환하는 테스트"""
-        stats = {"period": "2024-01", "posts": 10}
+        assert "#" in result["content"]  # 마크다운 헤더
+        assert "-" in result["content"]  # 마크다운 리스트
 
-        report_generator._format_markdown.return_value = "# 리포트\n내용"
+    def test_report_timestamp(self, frozen_now):
+        """리포트 생성 시간 확인 테스트"""
+        generator = MagicMock()
+        generator.generate_weekly_report.return_value = {
+            "type": "weekly",
+            "generated_at": frozen_now.isoformat(),
+            "content": "..."
+        }
 
-        result = report_generator._format_markdown(stats, "week")
+        result = generator.generate_weekly_report()
 
-        assert isinstance(result, str)
-        assert len(result) > 0
+        assert "generated_at" in result
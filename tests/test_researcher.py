@@ -3,106 +3,58 @@
 KeywordAnalyzer와 CompetitorScanner 기능 테스트
 """
 
+import operator
 import pytest
-from unittest.mock import MagicMock, patch
 
+from tests.stubs import shared_mock
 
-class TestKeywordAnalyzer:
-    """KeywordAnalyzer 클래스 테스트"""
-
-    @pytest.fixture
-    def keyword_analyzer(self, temp_db):
-        """KeywordAnalyzer 인스턴스 생성"""
-        from unittest.mock import MagicMock
-        analyzer = MagicMock()
-        analyzer.db = temp_db
-        analyzer._calculate_score = MagicMock()
-        analyzer._generate_signature = MagicMock()
-        analyzer.analyze_keywords = MagicMock()
-        return analyzer
-
-    def test_calculate_score_high_volume_low_competition(self, keyword_analyzer):
-        """높은 검색량, 낮은 경쟁도 점수 계산 테스트"""
-        # 최고의 조건: 높은 검색량, 낮은 경쟁도
-        volume = 5000
-        competition = 20
-        relevance = 0.9
-
-        keyword_analyzer._calculate_score.return_value = 85.0
-
-        score = keyword_analyzer._calculate_score(volume, competition, relevance)
-
-        assert score > 75
-        assert isinstance(score, float)
-        keyword_analyzer._calculate_score.assert_called_once_with(volume, competition, relevance)
-
-    def test_calculate_score_low_volume_low_competition(self, keyword_analyzer):
-        """낮은 검색량, 낮은 경쟁도 점수 계산 테스트"""
-        # 좋은 기회 키워드
-        volume = 500
-        competition = 15
-        relevance = 0.85
-
-        keyword_analyzer._calculate_score.return_value = 72.0
-
-        score = keyword_analyzer._calculate_score(volume, competition, relevance)
-
-        assert score > 60
-        assert isinstance(score, float)
+# KeywordAnalyzer / CompetitorScanner 목 (모듈당 1회 생성, 테스트마다 초기화)
+keyword_analyzer = shared_mock(
+    "keyword_analyzer", "_calculate_score", "_generate_signature", "analyze_keywords"
+)
+competitor_scanner = shared_mock(
+    "competitor_scanner", "_calculate_competition_score", "analyze_competitors"
+)
 
-    def test_calculate_score_high_volume_high_competition(self, keyword_analyzer):
-        """높은 검색량, 높은 경쟁도 점수 계산 테스트"""
-        # 어려운 키워드
-        volume = 10000
-        competition = 85
-        relevance = 0.7
 
-        keyword_analyzer._calculate_score.return_value = 55.0
-
-        score = keyword_analyzer._calculate_score(volume, competition, relevance)
-
-        assert score < 70
-        assert isinstance(score, float)
-
-    def test_calculate_score_zero_volume(self, keyword_analyzer):
-        """검색량 0 점수 계산 테스트"""
-        volume = 0
-        competition = 50
-        relevance = 0.5
+class TestKeywordAnalyzer:
+    """KeywordAnalyzer 클래스 테스트"""
 
-        keyword_analyzer._calculate_score.return_value = 0.0
+    # 서명 side_effect 값 (클래스당 1회 생성)
+    _SIGNATURES = ("sig1", "sig2")
+
+    def test_return_types_contract(self, keyword_analyzer):
+        """점수 반환 타입 계약 테스트 (float)"""
+        keyword_analyzer._calculate_score.return_value = 1.0
+
+        assert isinstance(keyword_analyzer._calculate_score(0, 0, 0.0), float)
+
+    @pytest.mark.parametrize("volume, competition, relevance, return_value, op, bound", [
+        (5000, 20, 0.9, 85.0, operator.gt, 75),    # 최고의 조건
+        (500, 15, 0.85, 72.0, operator.gt, 60),    # 좋은 기회 키워드
+        (10000, 85, 0.7, 55.0, operator.lt, 70),   # 어려운 키워드
+        (0, 50, 0.5, 0.0, operator.ge, 0),
+        (3000, 40, 0.95, 78.5, operator.gt, 70),
+        (3000, 40, 0.3, 45.0, operator.lt, 70),
+    ], ids=[
+        "high_volume_low_competition",
+        "low_volume_low_competition",
+        "high_volume_high_competition",
+        "zero_volume",
+        "high_relevance",
+        "low_relevance",
+    ])
+    def test_calculate_score(
+        self, keyword_analyzer, volume, competition, relevance, return_value, op, bound
+    ):
+        """검색량/경쟁도/관련성 조합별 점수 계산 테스트"""
+        keyword_analyzer._calculate_score.return_value = return_value
 
         score = keyword_analyzer._calculate_score(volume, competition, relevance)
 
-        assert score >= 0
+        assert op(score, bound)
         keyword_analyzer._calculate_score.assert_called_once_with(volume, competition, relevance)
 
-    def test_calculate_score_high_relevance(self, keyword_analyzer):
-        """높은 관련성 점수 계산 테스트"""
-        volume = 3000
-        competition = 40
-        relevance = 0.95  # 높은 관련성
-
-        keyword_analyzer._calculate_score.return_value = 78.5
-
-        score = keyword_analyzer._calculate_score(volume, competition, relevance)
-
-        assert score > 70
-        assert isinstance(score, float)
-
-    def test_calculate_score_low_relevance(self, keyword_analyzer):
-        """낮은 관련성 점수 계산 테스트"""
-        volume = 3000
-        competition = 40
-        relevance = 0.3  # 낮은 관련성
-
-        keyword_analyzer._calculate_score.return_value = 45.0
-
-        score = keyword_analyzer._calculate_score(volume, competition, relevance)
-
-        assert score < 70
-        assert isinstance(score, float)
-
     def test_generate_signature(self, keyword_analyzer):
         """서명 생성 테스트"""
         timestamp = "2024-01-01T12:00:00"
@@ -124,10 +76,7 @@ class TestKeywordAnalyzer:
         method = "POST"
         uri = "/api/keywords/analyze"
 
-        sig1 = "sig1"
-        sig2 = "sig2"
-
-        keyword_analyzer._generate_signature.side_effect = [sig1, sig2]
+        keyword_analyzer._generate_signature.side_effect = self._SIGNATURES
 
         result1 = keyword_analyzer._generate_signature(timestamp, method, uri)
         result2 = keyword_analyzer._generate_signature(timestamp, "GET", uri)
@@ -166,16 +115,6 @@ class TestKeywordAnalyzer:
 class TestCompetitorScanner:
     """CompetitorScanner 클래스 테스트"""
 
-    @pytest.fixture
-    def competitor_scanner(self, temp_db):
-        """CompetitorScanner 인스턴스 생성"""
-        from unittest.mock import MagicMock
-        scanner = MagicMock()
-        scanner.db = temp_db
-        scanner._calculate_competition_score = MagicMock()
-        scanner.analyze_competitors = MagicMock()
-        return scanner
-
     def test_calculate_competition_score_multiple_posts(self, competitor_scanner, sample_competitor_posts):
         """여러 경쟁사 포스트의 경쟁도 점수 계산 테스트"""
         competitor_scanner._calculate_competition_score.return_value = 65.0
@@ -185,66 +124,40 @@ class TestCompetitorScanner:
         assert 0 <= score <= 100
         assert isinstance(score, float)
 
-    def test_calculate_competition_score_high_engagement(self, competitor_scanner):
-        """높은 참여도 포스트의 경쟁도 점수 테스트"""
-        high_engagement_posts = [
-            {"views": 10000, "likes": 500},
-            {"views": 8000, "likes": 400},
-            {"views": 9500, "likes": 450}
-        ]
-
-        competitor_scanner._calculate_competition_score.return_value = 85.0
-
-        score = competitor_scanner._calculate_competition_score(high_engagement_posts)
-
-        assert score > 70
-        competitor_scanner._calculate_competition_score.assert_called_once()
-
-    def test_calculate_competition_score_low_engagement(self, competitor_scanner):
-        """낮은 참여도 포스트의 경쟁도 점수 테스트"""
-        low_engagement_posts = [
-            {"views": 100, "likes": 5},
-            {"views": 150, "likes": 8},
-            {"views": 120, "likes": 6}
-        ]
-
-        competitor_scanner._calculate_competition_score.return_value = 25.0
-
-        score = competitor_scanner._calculate_competition_score(low_engagement_posts)
-
-        assert score < 40
-
-    def test_calculate_competition_score_empty_list(self, competitor_scanner):
-        """빈 포스트 목록의 경쟁도 점수 테스트"""
-        empty_posts = []
-
-        competitor_scanner._calculate_competition_score.return_value = 0.0
-
-        score = competitor_scanner._calculate_competition_score(empty_posts)
-
-        assert score == 0.0
-
-    def test_calculate_competition_score_single_post(self, competitor_scanner):
-        """단일 포스트의 경쟁도 점수 테스트"""
-        single_post = [{"views": 5000, "likes": 250}]
-
-        competitor_scanner._calculate_competition_score.return_value = 50.0
-
-        score = competitor_scanner._calculate_competition_score(single_post)
-
-        assert 0 <= score <= 100
-
-    def test_calculate_competition_score_weighted_by_engagement(self, competitor_scanner):
-        """참여도 기반 가중 점수 계산 테스트"""
-        posts = [
-            {"views": 1000, "likes": 10},   # 낮은 참여도
-            {"views": 5000, "likes": 500},  # 높은 참여도
-        ]
-
-        competitor_scanner._calculate_competition_score.return_value = 55.0
+    @pytest.mark.parametrize("posts, return_value, op, bound", [
+        (
+            [
+                {"views": 10000, "likes": 500},
+                {"views": 8000, "likes": 400},
+                {"views": 9500, "likes": 450},
+            ],
+            85.0, operator.gt, 70,
+        ),
+        (
+            [
+                {"views": 100, "likes": 5},
+                {"views": 150, "likes": 8},
+                {"views": 120, "likes": 6},
+            ],
+            25.0, operator.lt, 40,
+        ),
+        ([], 0.0, operator.eq, 0.0),
+        ([{"views": 5000, "likes": 250}], 50.0, operator.le, 100),
+        (
+            [
+                {"views": 1000, "likes": 10},   # 낮은 참여도
+                {"views": 5000, "likes": 500},  # 높은 참여도
+            ],
+            55.0, operator.ge, 0,
+        ),
+    ], ids=["high_engagement", "low_engagement", "empty", "single", "weighted"])
+    def test_calculate_competition_score(self, competitor_scanner, posts, return_value, op, bound):
+        """참여도 유형별 경쟁도 점수 계산 테스트"""
+        competitor_scanner._calculate_competition_score.return_value = return_value
 
         score = competitor_scanner._calculate_competition_score(posts)
 
+        assert op(score, bound)
         assert isinstance(score, float)
         competitor_scanner._calculate_competition_score.assert_called_once_with(posts)
 
@@ -5,9 +5,15 @@ SQLite 데이터베이스 관리
            posts, posting_history, ranking_history
 """
 
+import hashlib
+import re
 import sqlite3
+import threading
 from pathlib import Path
 from contextlib import contextmanager
+from typing import Iterable
+from models.blog import Blog, BLOG_COLUMNS
+from utils.jsonutil import json_dumps
 from utils.logger import get_logger
 
 logger = get_logger()
@@ -161,68 +167,305 @@ CREATE INDEX IF NOT EXISTS idx_articles_url ON articles(url);
 CREATE INDEX IF NOT EXISTS idx_articles_category ON articles(category);
 CREATE INDEX IF NOT EXISTS idx_keywords_keyword ON keywords(keyword);
 CREATE INDEX IF NOT EXISTS idx_keywords_score ON keywords(total_score DESC);
-CREATE INDEX IF NOT EXISTS idx_posts_status ON posts(status);
 CREATE INDEX IF NOT EXISTS idx_posting_history_status ON posting_history(publish_status);
 CREATE INDEX IF NOT EXISTS idx_ranking_history_keyword ON ranking_history(keyword);
 CREATE INDEX IF NOT EXISTS idx_legal_references_post ON legal_references(post_id);
 CREATE INDEX IF NOT EXISTS idx_legal_references_law ON legal_references(law_name_normalized);
 CREATE INDEX IF NOT EXISTS idx_legal_changes_law ON legal_changes(law_name);
+
+-- 복합 인덱스 (상태 필터 + 정렬/조인)
+CREATE INDEX IF NOT EXISTS idx_posts_status_created ON posts(status, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_posting_history_post_status ON posting_history(post_id, publish_status);
+CREATE INDEX IF NOT EXISTS idx_legal_refs_status ON legal_references(verification_status, post_id);
 """
 
+# 스키마 객체별 DDL (이름 → CREATE 문), 정의 순서 유지
+_SCHEMA_STATEMENTS: dict[str, str] = {
+    m.group(2): m.group(0)
+    for m in re.finditer(
+        r"CREATE (TABLE|INDEX) IF NOT EXISTS (\w+)[^;]*;", SCHEMA_SQL
+    )
+}
+
+# 스키마 변경 감지용 해시 (PRAGMA user_version은 32비트 정수)
+_SCHEMA_VERSION_HASH = int(
+    hashlib.blake2b(SCHEMA_SQL.encode(), digest_size=4).hexdigest(), 16
+) & 0x7FFFFFFF
+
+
+# list_blogs 조회 컬럼 (Blog 필드 순서와 동일)
+_BLOG_SELECT = ", ".join(BLOG_COLUMNS)
+
+# 자주 쓰는 블로그 조회 쿼리 (같은 문자열로 문장 캐시 재사용)
+_Q_BLOG_BY_ID = "SELECT * FROM blogs WHERE id = ?"
+_Q_BLOG_BY_NAME = "SELECT * FROM blogs WHERE name = ?"
+_Q_BLOG_DEFAULT = "SELECT * FROM blogs WHERE active = 1 ORDER BY id LIMIT 1"
+_Q_LIST_BLOGS_ACTIVE = f"SELECT {_BLOG_SELECT} FROM blogs WHERE active = 1 ORDER BY id"
+_Q_LIST_BLOGS_ALL = f"SELECT {_BLOG_SELECT} FROM blogs ORDER BY id"
+
+
+# 연결 생성 시 1회만 적용하는 PRAGMA
+CONNECTION_PRAGMAS = (
+    "PRAGMA page_size=8192",          # 새 DB 파일에만 적용 (대용량 html 행의 overflow 페이지 감소)
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",       # 64MB 페이지 캐시
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA mmap_size=268435456",     # 256MB
+    "PRAGMA wal_autocheckpoint=10000",
+)
+
+
+def _md5_digest(value) -> bytes | None:
+    """SQLite md5() 사용자 함수 구현 (TEXT는 UTF-8 기준)"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.encode()
+    return hashlib.md5(value).digest()
+
+
+def _quote_ident(name: str) -> str:
+    """SQL 식별자 인용 (PRAGMA 인자 등 바인딩할 수 없는 위치용)"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+# 스레드별 연결 캐시 (db_path → 연결), 모든 Database 인스턴스가 공유
+_thread_local = threading.local()
+
+
+def _thread_connections() -> dict[str, sqlite3.Connection]:
+    """현재 스레드의 연결 캐시 반환"""
+    conns = getattr(_thread_local, "conns", None)
+    if conns is None:
+        conns = _thread_local.conns = {}
+    return conns
+
+
+def _thread_blog_caches() -> dict[str, tuple[tuple, dict]]:
+    """현재 스레드의 블로그 캐시 반환 (db_path → (데이터 버전, 조회 결과))"""
+    caches = getattr(_thread_local, "blog_caches", None)
+    if caches is None:
+        caches = _thread_local.blog_caches = {}
+    return caches
+
 
 class Database:
-    """SQLite 데이터베이스 매니저"""
+    """SQLite 데이터베이스 매니저 (같은 DB 파일은 스레드별 연결을 인스턴스 간 공유)"""
 
     def __init__(self, db_path: str | Path):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # 요청마다 인스턴스를 새로 만들어도 같은 파일이면 연결을 재사용하도록 정규화
+        self._conn_key = str(self.db_path.resolve())
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """현재 스레드의 캐시된 연결 반환 (없으면 생성 후 PRAGMA 설정)"""
+        conns = _thread_connections()
+        conn = conns.get(self._conn_key)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.db_path),
+                check_same_thread=False,
+                isolation_level=None,  # 트랜잭션은 get_connection에서 명시적으로 관리
+                cached_statements=512,  # 준비된 문장 캐시 (기본 128)
+            )
+            conn.row_factory = sqlite3.Row
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            # 본문을 Python으로 가져오지 않고 SQL에서 해시 계산 (SELECT md5(html) ...)
+            conn.create_function("md5", 1, _md5_digest, deterministic=True)
+            conns[self._conn_key] = conn
+        return conn
 
     @contextmanager
-    def get_connection(self):
-        """컨텍스트 매니저로 DB 연결 관리"""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA foreign_keys=ON")
+    def _transaction_scope(self, begin_sql: str):
+        """트랜잭션 범위 관리 (중첩 시 바깥 블록이 커밋/롤백 담당)"""
+        conn = self._get_conn()
+        if conn.in_transaction:
+            yield conn
+            return
+
+        conn.execute(begin_sql)
         try:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
+            if conn.in_transaction:
+                conn.execute("COMMIT")
+        except BaseException:
+            # KeyboardInterrupt 등도 롤백해야 캐시된 연결에 트랜잭션이 남지 않음
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
             raise
+
+    @contextmanager
+    def get_connection(self):
+        """컨텍스트 매니저로 DB 연결 관리 (트랜잭션 단위 커밋/롤백)"""
+        with self._transaction_scope("BEGIN") as conn:
+            yield conn
+
+    @contextmanager
+    def transaction(self):
+        """
+        여러 쓰기를 하나의 트랜잭션으로 묶음 (BEGIN IMMEDIATE)
+
+        블록 안의 execute/insert/execute_many 호출은 같은 연결에서 실행되며
+        블록이 끝날 때 한 번만 커밋됩니다.
+
+        Example:
+            with db.transaction() as tx:
+                tx.insert("INSERT INTO articles ...", (...))
+                tx.execute_many("INSERT INTO keyword_history ...", rows)
+        """
+        with self._transaction_scope("BEGIN IMMEDIATE"):
+            yield self
+
+    @contextmanager
+    def bulk_insert(self, *tables: str):
+        """
+        대량 삽입용 트랜잭션 (행별 외래 키 검사 생략, 커밋 전 1회 검증)
+
+        PRAGMA foreign_keys는 트랜잭션 안에서 바뀌지 않으므로, 이미 열린
+        트랜잭션 안에서 호출하면 일반 transaction()처럼 동작합니다.
+
+        Args:
+            tables: 블록에서 쓰는 테이블 (이 테이블만 외래 키 검증)
+
+        Example:
+            with db.bulk_insert("processed_articles") as tx:
+                tx.execute_many("INSERT INTO processed_articles ...", rows)
+
+        Raises:
+            ValueError: 검증할 테이블을 지정하지 않은 경우
+            sqlite3.IntegrityError: 커밋 전 외래 키 위반이 발견된 경우 (전체 롤백)
+        """
+        if not tables:
+            raise ValueError("bulk_insert에는 검증할 테이블을 지정해야 합니다")
+
+        conn = self._get_conn()
+        if conn.in_transaction:
+            yield self
+            return
+
+        conn.execute("PRAGMA foreign_keys=OFF")
+        try:
+            with self._transaction_scope("BEGIN IMMEDIATE"):
+                yield self
+                violations = [
+                    row
+                    for table in tables
+                    for row in conn.execute(f"PRAGMA foreign_key_check({_quote_ident(table)})")
+                ]
+                if violations:
+                    table, rowid, parent = violations[0][:3]
+                    raise sqlite3.IntegrityError(
+                        f"FOREIGN KEY constraint failed: {table} rowid={rowid} -> {parent} "
+                        f"(총 {len(violations)}건)"
+                    )
         finally:
+            conn.execute("PRAGMA foreign_keys=ON")
+
+    def close(self):
+        """현재 스레드의 캐시된 연결 종료"""
+        conn = _thread_connections().pop(self._conn_key, None)
+        # 데이터 버전은 연결 단위 값이므로 연결과 함께 캐시도 폐기
+        _thread_blog_caches().pop(self._conn_key, None)
+        if conn is not None:
             conn.close()
 
     def init_db(self):
-        """데이터베이스 초기화 (테이블 생성)"""
+        """
+        데이터베이스 초기화 (없는 테이블/인덱스만 생성)
+
+        스키마 해시가 PRAGMA user_version과 같으면 바로 반환하고,
+        다르면 sqlite_master와 비교해 누락된 DDL만 한 트랜잭션으로 실행합니다.
+        """
+        conn = self._get_conn()
+        if conn.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION_HASH:
+            return
+
         with self.get_connection() as conn:
-            conn.executescript(SCHEMA_SQL)
-        logger.info(f"데이터베이스 초기화 완료: {self.db_path}")
+            existing = {
+                row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type IN ('table', 'index')"
+                )
+            }
+            missing = [
+                ddl for name, ddl in _SCHEMA_STATEMENTS.items() if name not in existing
+            ]
+            for ddl in missing:
+                conn.execute(ddl)
+            if missing:
+                # 새 인덱스를 플래너가 사용하도록 통계 갱신
+                conn.execute("ANALYZE")
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION_HASH}")
+
+        logger.info("데이터베이스 초기화 완료: {} (생성 {}개)", self.db_path, len(missing))
 
     def execute(self, query: str, params: tuple = ()) -> list[sqlite3.Row]:
-        """쿼리 실행 및 결과 반환"""
+        """쿼리 실행 및 전체 결과 반환 (fetchall로 메모리에 적재)"""
         with self.get_connection() as conn:
             cursor = conn.execute(query, params)
             return cursor.fetchall()
 
-    def execute_many(self, query: str, params_list: list[tuple]):
-        """여러 행 삽입"""
+    @contextmanager
+    def iter_rows(self, query: str, params: tuple = (), arraysize: int = 1000):
+        """
+        쿼리 결과를 한 행씩 스트리밍 (대량 조회용)
+
+        Example:
+            with db.iter_rows("SELECT url FROM articles") as rows:
+                for row in rows:
+                    ...
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.arraysize = arraysize
+            try:
+                yield iter(cursor.execute(query, params))
+            finally:
+                cursor.close()
+
+    def fetch_tuples(self, query: str, params: tuple = ()) -> list[tuple]:
+        """쿼리 실행 결과를 튜플로 반환 (Row 객체 생성 생략, 대량 조회용)"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            return cursor.execute(query, params).fetchall()
+
+    def fetch_dicts(self, query: str, params: tuple = ()) -> list[dict]:
+        """쿼리 실행 결과를 딕셔너리로 반환 (컬럼명은 cursor.description 기준)"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            rows = cursor.execute(query, params).fetchall()
+            cols = [d[0] for d in cursor.description]
+            return [dict(zip(cols, row)) for row in rows]
+
+    def execute_many(self, query: str, params_list: Iterable[tuple]):
+        """여러 행 삽입 (제너레이터 전달 가능)"""
         with self.get_connection() as conn:
             conn.executemany(query, params_list)
 
-    def insert(self, query: str, params: tuple = ()) -> int:
-        """단일 행 삽입 후 ID 반환"""
+    def insert(self, query: str, params: tuple = ()) -> int | None:
+        """단일 행 삽입 후 ID 반환 (INSERT OR IGNORE로 무시되면 None)"""
         with self.get_connection() as conn:
             cursor = conn.execute(query, params)
-            return cursor.lastrowid
+            # lastrowid는 연결 단위 값이므로 이번 문장이 행을 넣었을 때만 유효
+            return cursor.lastrowid if cursor.rowcount > 0 else None
+
+    def get_article_size(self, article_id: int) -> int | None:
+        """기사 html 길이 반환 (본문을 가져오지 않고 SQL에서 계산)"""
+        rows = self.fetch_tuples("SELECT length(html) FROM articles WHERE id = ?", (article_id,))
+        return rows[0][0] if rows else None
 
     def count(self, table: str, where: str = "", params: tuple = ()) -> int:
         """테이블 행 수 반환"""
         query = f"SELECT COUNT(*) as cnt FROM {table}"
         if where:
             query += f" WHERE {where}"
-        rows = self.execute(query, params)
-        return rows[0]["cnt"] if rows else 0
+        rows = self.fetch_tuples(query, params)
+        return rows[0][0] if rows else 0
 
     # ===== 멀티 블로그 관련 메서드 =====
 
@@ -235,19 +478,43 @@ class Database:
             blog_name: 블로그 이름
 
         Returns:
-            블로그 설정 딕셔너리 또는 None
+            블로그 설정 딕셔너리 또는 None (캐시된 행의 복사본)
         """
+        conn = self._get_conn()
+        # 트랜잭션 중에는 롤백될 수 있는 값을 읽고 쓰지 않도록 캐시 우회
+        entries = None if conn.in_transaction else self._blog_cache_entries(conn)
+
+        cache_key = (blog_id, blog_name)
+        row = entries.get(cache_key) if entries is not None else None
+        if row is not None:
+            return dict(row)
+
         if blog_id:
-            rows = self.execute("SELECT * FROM blogs WHERE id = ?", (blog_id,))
+            rows = self.fetch_dicts(_Q_BLOG_BY_ID, (blog_id,))
         elif blog_name:
-            rows = self.execute("SELECT * FROM blogs WHERE name = ?", (blog_name,))
+            rows = self.fetch_dicts(_Q_BLOG_BY_NAME, (blog_name,))
         else:
             # 기본 블로그 (첫 번째)
-            rows = self.execute("SELECT * FROM blogs WHERE active = 1 ORDER BY id LIMIT 1")
-
-        return dict(rows[0]) if rows else None
-
-    def list_blogs(self, active_only: bool = True) -> list[dict]:
+            rows = self.fetch_dicts(_Q_BLOG_DEFAULT)
+
+        if not rows:
+            return None
+
+        if entries is not None:
+            entries[cache_key] = rows[0]
+        return dict(rows[0])
+
+    def _blog_cache_entries(self, conn: sqlite3.Connection) -> dict:
+        """현재 스레드의 블로그 캐시 항목 반환 (DB가 바뀌었으면 비움)"""
+        # 다른 연결(프로세스)의 커밋은 data_version, 이 연결의 쓰기는 total_changes로 감지
+        token = (conn.execute("PRAGMA data_version").fetchone()[0], conn.total_changes)
+        caches = _thread_blog_caches()
+        cached = caches.get(self._conn_key)
+        if cached is None or cached[0] != token:
+            cached = caches[self._conn_key] = (token, {})
+        return cached[1]
+
+    def list_blogs(self, active_only: bool = True) -> list[Blog]:
         """
         모든 블로그 목록 조회
 
@@ -255,14 +522,10 @@ class Database:
             active_only: 활성화된 블로그만 조회
 
         Returns:
-            블로그 목록
+            블로그 목록 (딕셔너리가 필요하면 blog.as_dict())
         """
-        if active_only:
-            rows = self.execute("SELECT * FROM blogs WHERE active = 1 ORDER BY id")
-        else:
-            rows = self.execute("SELECT * FROM blogs ORDER BY id")
-
-        return [dict(row) for row in rows]
+        rows = self.fetch_tuples(_Q_LIST_BLOGS_ACTIVE if active_only else _Q_LIST_BLOGS_ALL)
+        return [Blog(*row) for row in rows]
 
     def create_blog(self, blog_data: dict) -> int:
         """
@@ -274,8 +537,6 @@ class Database:
         Returns:
             생성된 블로그 ID
         """
-        import json
-
         query = """
             INSERT INTO blogs (
                 name, display_name, domain, description, theme,
@@ -291,9 +552,9 @@ class Database:
             blog_data.get("description"),
             blog_data.get("theme", "default"),
             blog_data["system_prompt"],
-            json.dumps(blog_data.get("categories", [])),
-            json.dumps(blog_data.get("crawler_configs", {})),
-            json.dumps(blog_data.get("verification_modules", [])),
+            json_dumps(blog_data.get("categories", [])),
+            json_dumps(blog_data.get("crawler_configs", {})),
+            json_dumps(blog_data.get("verification_modules", [])),
             blog_data.get("monthly_budget", 5000),
             blog_data.get("max_posts_per_day", 2),
         )
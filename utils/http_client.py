@@ -4,11 +4,45 @@
 """
 
 import asyncio
+import random
 import aiohttp
 from utils.logger import get_logger
 
 logger = get_logger()
 
+# 이 크기를 넘는 응답 본문은 이벤트 루프 밖(스레드)에서 디코딩
+_THREAD_DECODE_THRESHOLD = 1024 * 1024
+
+# 재시도 대상 응답 코드 (Retry-After 헤더 확인)
+_RETRY_STATUSES = frozenset({429, 503})
+
+
+def create_session(
+    max_concurrent: int = 10,
+    timeout: int = 30,
+    user_agent: str = "",
+) -> aiohttp.ClientSession:
+    """
+    연결 풀/DNS 캐시를 유지하는 공유 세션 생성
+
+    여러 AsyncHTTPClient가 같은 세션을 쓰면 keep-alive 연결과
+    TLS 세션이 재사용됩니다. 종료는 생성한 쪽에서 close()로 처리합니다.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=max_concurrent,
+        limit_per_host=max(4, max_concurrent // 4),
+        ttl_dns_cache=300,
+        use_dns_cache=True,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True,
+    )
+    headers = {"User-Agent": user_agent} if user_agent else {}
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        headers=headers,
+    )
+
 
 class AsyncHTTPClient:
     """비동기 HTTP 클라이언트"""
@@ -19,27 +53,42 @@ class AsyncHTTPClient:
         timeout: int = 30,
         user_agent: str = "",
         retries: int = 3,
+        session: aiohttp.ClientSession | None = None,
+        retry_base: float = 1.0,
+        retry_cap: float = 30.0,
     ):
         self.max_concurrent = max_concurrent
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.user_agent = user_agent
         self.retries = retries
+        self.retry_base = retry_base
+        self.retry_cap = retry_cap
         self._semaphore = asyncio.Semaphore(max_concurrent)
-        self._session: aiohttp.ClientSession | None = None
+        self._session: aiohttp.ClientSession | None = session
+        # 외부에서 받은 세션은 닫지 않음
+        self._own_session = session is None
 
     async def __aenter__(self):
-        headers = {}
-        if self.user_agent:
-            headers["User-Agent"] = self.user_agent
-        self._session = aiohttp.ClientSession(
-            timeout=self.timeout,
-            headers=headers,
-        )
+        if self._session is None or self._session.closed:
+            self._session = create_session(
+                self.max_concurrent,
+                int(self.timeout.total),
+                self.user_agent,
+            )
+            self._own_session = True
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._session:
+        if self._own_session:
+            await self.aclose()
+
+    async def aclose(self):
+        """직접 생성한 세션 종료"""
+        if not self._own_session:
+            return
+        if self._session and not self._session.closed:
             await self._session.close()
+        self._session = None
 
     async def get(self, url: str, **kwargs) -> dict:
         """GET 요청 (재시도 포함)"""
@@ -51,32 +100,138 @@ class AsyncHTTPClient:
 
     async def _request(self, method: str, url: str, **kwargs) -> dict:
         """HTTP 요청 실행 (세마포어 + 재시도)"""
+        kwargs = self._request_kwargs(kwargs)
+
         async with self._semaphore:
             last_error = None
+            delay = self.retry_base
             for attempt in range(1, self.retries + 1):
+                retry_after = None
                 try:
                     async with self._session.request(method, url, **kwargs) as resp:
-                        text = await resp.text()
-                        return {
-                            "status": resp.status,
-                            "text": text,
-                            "url": str(resp.url),
-                            "headers": dict(resp.headers),
-                        }
+                        if resp.status in _RETRY_STATUSES and attempt < self.retries:
+                            retry_after = self._parse_retry_after(resp.headers.get("Retry-After"))
+                            logger.warning(
+                                "요청 제한 응답 {} (시도 {}/{}): {}",
+                                resp.status, attempt, self.retries, url,
+                            )
+                        else:
+                            text = await self._read_text(resp)
+                            return {
+                                "status": resp.status,
+                                "text": text,
+                                "url": str(resp.url),
+                                "headers": dict(resp.headers),
+                            }
                 except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                     last_error = e
-                    logger.warning(f"요청 실패 (시도 {attempt}/{self.retries}): {url} - {e}")
-                    if attempt < self.retries:
-                        await asyncio.sleep(2 ** attempt)
+                    logger.warning("요청 실패 (시도 {}/{}): {} - {}", attempt, self.retries, url, e)
+                    if attempt == self.retries:
+                        break
+
+                if retry_after is not None:
+                    await asyncio.sleep(min(self.retry_cap, retry_after))
+                else:
+                    # decorrelated jitter: 동시 재시도가 같은 시각에 몰리지 않도록 분산
+                    delay = min(self.retry_cap, random.uniform(self.retry_base, delay * 3))
+                    await asyncio.sleep(delay)
 
-            logger.error(f"요청 최종 실패: {url} - {last_error}")
+            logger.error("요청 최종 실패: {} - {}", url, last_error)
             return {"status": 0, "text": "", "url": url, "error": str(last_error)}
 
+    def _request_kwargs(self, kwargs: dict) -> dict:
+        """
+        요청 인자 보정 (공유 세션에는 클라이언트별 User-Agent/timeout이 없으므로 요청에 지정)
+
+        호출자가 넘긴 headers 딕셔너리는 수정하지 않습니다.
+        """
+        if self._own_session:
+            return kwargs
+        kwargs = dict(kwargs)
+        if self.user_agent:
+            kwargs["headers"] = {"User-Agent": self.user_agent, **(kwargs.get("headers") or {})}
+        kwargs.setdefault("timeout", self.timeout)
+        return kwargs
+
+    @staticmethod
+    def _parse_retry_after(value: str | None) -> float | None:
+        """Retry-After 헤더(초 단위) 파싱, 날짜 형식이나 잘못된 값은 None"""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None
+
+    @staticmethod
+    async def _read_text(resp: aiohttp.ClientResponse) -> str:
+        """응답 본문 디코딩 (resp.text()와 같은 strict 디코딩, 큰 본문은 스레드에서 처리)"""
+        raw = await resp.read()
+        encoding = resp.get_encoding()
+        if len(raw) > _THREAD_DECODE_THRESHOLD:
+            return await asyncio.to_thread(raw.decode, encoding)
+        return raw.decode(encoding)
+
+    async def stream(self, url: str, chunk_size: int = 65536, **kwargs):
+        """
+        GET 응답 본문을 청크 단위로 전달 (재시도 없음)
+
+        Example:
+            async for chunk in client.stream(url):
+                parser.feed(chunk)
+        """
+        kwargs = self._request_kwargs(kwargs)
+
+        async with self._semaphore:
+            async with self._session.get(url, **kwargs) as resp:
+                resp.raise_for_status()
+                async for chunk in resp.content.iter_chunked(chunk_size):
+                    yield chunk
+
+    async def _rate_limited_get(self, url: str, start_at: float) -> dict:
+        """예약된 시각까지 대기 후 GET 요청 (요청 간격 유지)"""
+        wait = start_at - asyncio.get_running_loop().time()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return await self.get(url)
+
+    def _schedule_gets(self, urls: list[str], delay: float) -> list[asyncio.Task]:
+        """URL별 GET 태스크 생성 (시작 시각을 delay 간격으로 예약)"""
+        now = asyncio.get_running_loop().time()
+        return [
+            asyncio.create_task(self._rate_limited_get(url, now + i * delay))
+            for i, url in enumerate(urls)
+        ]
+
     async def get_many(self, urls: list[str], delay: float = 0) -> list[dict]:
-        """여러 URL 동시 요청"""
-        tasks = []
-        for i, url in enumerate(urls):
-            if delay and i > 0:
-                await asyncio.sleep(delay)
-            tasks.append(self.get(url))
+        """
+        여러 URL 동시 요청
+
+        delay가 있으면 각 요청의 시작 시각을 delay 간격으로 예약합니다.
+        태스크는 한 번에 생성되며 동시 실행 수는 세마포어가 제한합니다.
+        """
+        tasks = self._schedule_gets(urls, delay)
         return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def iter_many(self, urls: list[str], delay: float = 0):
+        """
+        여러 URL 동시 요청 후 완료 순서대로 결과 전달
+
+        get_many와 달리 모든 요청을 기다리지 않으므로 먼저 끝난 응답부터
+        처리할 수 있습니다. 예외는 get_many와 같이 결과로 전달합니다.
+
+        Example:
+            async for result in client.iter_many(urls):
+                process(result)
+        """
+        tasks = self._schedule_gets(urls, delay)
+        try:
+            for fut in asyncio.as_completed(tasks):
+                try:
+                    yield await fut
+                except Exception as e:
+                    yield e
+        finally:
+            # 소비자가 중간에 멈추면 남은 요청 취소
+            for task in tasks:
+                task.cancel()
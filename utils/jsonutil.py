@@ -0,0 +1,22 @@
+"""
+JSON 직렬화 헬퍼 (orjson 기반, 없으면 표준 json fallback)
+
+주의: orjson은 str이 아닌 dict 키(int 등)를 거부(TypeError)하지만,
+표준 json.dumps는 이를 문자열로 변환한다. 두 환경에서 같은 결과를 얻으려면
+dict 키는 str로 넘길 것.
+"""
+
+# orjson 사용 가능 여부 확인 (없으면 표준 json fallback)
+try:
+    import orjson
+
+    def json_dumps(obj) -> str:
+        """객체를 JSON 문자열로 직렬화"""
+        return orjson.dumps(obj).decode()
+
+    json_loads = orjson.loads
+except ImportError:
+    import json
+
+    json_dumps = json.dumps
+    json_loads = json.loads
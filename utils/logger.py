@@ -3,10 +3,14 @@
 """
 
 import sys
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 
 _initialized = False
+_queue_listener: logging.handlers.QueueListener | None = None
 
 # loguru 사용 가능 여부 확인
 try:
@@ -20,29 +24,30 @@ except ImportError:
 _stdlib_logger = logging.getLogger("autopilot")
 
 
+def _bind_level(is_enabled_for, level: int, emit, prefix: str = ""):
+    """레벨별 로그 함수 생성 (레벨 확인 후에만 loguru 방식({})으로 인자 포맷)"""
+    def log(msg, *args, **kwargs):
+        if not is_enabled_for(level):
+            return
+        if args or kwargs:
+            msg = str(msg).format(*args, **kwargs)
+        emit(f"{prefix}{msg}" if prefix else msg)
+    return log
+
+
 class _StdlibLoggerWrapper:
     """loguru와 동일한 인터페이스를 제공하는 표준 logging 래퍼"""
 
     def __init__(self, stdlib_logger):
         self._logger = stdlib_logger
-
-    def debug(self, msg, *args, **kwargs):
-        self._logger.debug(msg)
-
-    def info(self, msg, *args, **kwargs):
-        self._logger.info(msg)
-
-    def warning(self, msg, *args, **kwargs):
-        self._logger.warning(msg)
-
-    def error(self, msg, *args, **kwargs):
-        self._logger.error(msg)
-
-    def critical(self, msg, *args, **kwargs):
-        self._logger.critical(msg)
-
-    def success(self, msg, *args, **kwargs):
-        self._logger.info(f"✅ {msg}")
+        # 호출 시 메서드 탐색/중간 프레임 없이 바로 실행되도록 인스턴스 속성으로 바인딩
+        enabled = stdlib_logger.isEnabledFor
+        self.debug = _bind_level(enabled, logging.DEBUG, stdlib_logger.debug)
+        self.info = _bind_level(enabled, logging.INFO, stdlib_logger.info)
+        self.warning = _bind_level(enabled, logging.WARNING, stdlib_logger.warning)
+        self.error = _bind_level(enabled, logging.ERROR, stdlib_logger.error)
+        self.critical = _bind_level(enabled, logging.CRITICAL, stdlib_logger.critical)
+        self.success = _bind_level(enabled, logging.INFO, stdlib_logger.info, "✅ ")
 
     def remove(self, *args, **kwargs):
         pass
@@ -78,8 +83,15 @@ def setup_logger(log_level: str = "INFO", log_dir: Path | None = None):
             )
     else:
         # 표준 logging fallback
+        global _queue_listener
         level = getattr(logging, log_level.upper(), logging.INFO)
         _stdlib_logger.setLevel(level)
+
+        # 포맷에 쓰지 않는 스레드/프로세스 정보 수집 생략
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
         if not _stdlib_logger.handlers:
             handler = logging.StreamHandler(sys.stderr)
             handler.setLevel(level)
@@ -88,21 +100,32 @@ def setup_logger(log_level: str = "INFO", log_dir: Path | None = None):
                 datefmt="%Y-%m-%d %H:%M:%S",
             )
             handler.setFormatter(formatter)
-            _stdlib_logger.addHandler(handler)
+            handlers = [handler]
 
             if log_dir:
                 log_dir.mkdir(parents=True, exist_ok=True)
                 fh = logging.FileHandler(str(log_dir / "autopilot.log"))
                 fh.setLevel(level)
                 fh.setFormatter(formatter)
-                _stdlib_logger.addHandler(fh)
+                handlers.append(fh)
+
+            # 호출 스레드는 큐에 넣기만 하고, 포맷/출력은 리스너 스레드가 담당
+            log_queue = queue.SimpleQueue()
+            _stdlib_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            _queue_listener = logging.handlers.QueueListener(
+                log_queue, *handlers, respect_handler_level=True
+            )
+            _queue_listener.start()
+            atexit.register(_queue_listener.stop)
 
     _initialized = True
     return get_logger()
 
 
+# get_logger()가 반환할 로거 (import 시 1회 결정)
+_logger = _loguru_logger if _USE_LOGURU else _StdlibLoggerWrapper(_stdlib_logger)
+
+
 def get_logger():
     """로거 인스턴스 반환"""
-    if _USE_LOGURU:
-        return _loguru_logger
-    return _StdlibLoggerWrapper(_stdlib_logger)
+    return _logger